@@ -1,31 +1,174 @@
+import math
 import FreeCAD, Part, importDXF
+import ezdxf
 from FreeCAD import Vector
 
+TOL = 0.1  # mm - max gap between edge endpoints that still counts as connected
+SAVE_FCSTD = True  # False for STEP-only runs: skips document objects and recompute
+
+# Entity types read directly below; anything else with geometry (SPLINE, ELLIPSE,
+# INSERT, ...) makes the whole file go through importDXF instead
+DIRECT_TYPES = {"LINE", "ARC", "CIRCLE", "LWPOLYLINE", "POLYLINE"}
+IGNORED_TYPES = {"TEXT", "MTEXT", "DIMENSION", "LEADER", "MLEADER", "HATCH", "POINT", "VIEWPORT"}
+
+
+def stitch_closed_chains(segments, tol):
+    """
+    Chain loose segments (point lists: [start, end] or [start, mid, end]) whose
+    endpoints meet within tol. Endpoints are bucketed on a tol-sized grid, so each
+    step only probes the 3x3 cells around the current end instead of every segment.
+    Returns (closed chains as oriented point lists with the joints snapped together,
+    number of segments left in open chains).
+    """
+    def cell(p):
+        return (round(p[0] / tol), round(p[1] / tol))
+
+    buckets = {}
+    for i, pts in enumerate(segments):
+        buckets.setdefault(cell(pts[0]), []).append((i, False))
+        buckets.setdefault(cell(pts[-1]), []).append((i, True))
+
+    tol2 = tol * tol
+    used = set()
+    chains = []
+    open_segments = 0
+    for first in range(len(segments)):
+        if first in used:
+            continue
+        used.add(first)
+        chain = [list(segments[first])]
+        start = chain[0][0]
+        closed = False
+
+        while True:
+            end = chain[-1][-1]
+            dx, dy = end[0] - start[0], end[1] - start[1]
+            if len(chain) > 1 and dx*dx + dy*dy <= tol2:
+                chain[-1][-1] = start  # snap the closing joint
+                closed = True
+                break
+
+            match = None
+            cx, cy = cell(end)
+            for key in [(cx + i, cy + j) for i in (-1, 0, 1) for j in (-1, 0, 1)]:
+                for idx, at_end in buckets.get(key, ()):
+                    if idx in used:
+                        continue
+                    p = segments[idx][-1] if at_end else segments[idx][0]
+                    px, py = p[0] - end[0], p[1] - end[1]
+                    if px*px + py*py <= tol2:
+                        match = (idx, at_end)
+                        break
+                if match:
+                    break
+
+            if match is None:
+                break
+            idx, at_end = match
+            used.add(idx)
+            pts = list(reversed(segments[idx])) if at_end else list(segments[idx])
+            pts[0] = end  # snap the joint so the wire is watertight
+            chain.append(pts)
+
+        if closed:
+            chains.append(chain)
+        else:
+            open_segments += len(chain)
+    return chains, open_segments
+
+
+def bulge_segments(points, closed):
+    """
+    Segments of a polyline given as (x, y, bulge) vertices: [start, end] for straight
+    spans, [start, mid, end] for bulged ones (bulge = tan(sweep / 4), positive = CCW)
+    """
+    segments = []
+    n = len(points)
+    for i in range(n if closed else n - 1):
+        x0, y0, b = points[i]
+        x1, y1 = points[(i + 1) % n][:2]
+        if (x0, y0) == (x1, y1):
+            continue
+        if not b:
+            segments.append([(x0, y0), (x1, y1)])
+            continue
+        # Arc midpoint: sagitta b * chord / 2 off the chord midpoint, to the right of
+        # the chord direction for a CCW arc
+        dx, dy = x1 - x0, y1 - y0
+        h = b / 2
+        segments.append([(x0, y0), ((x0 + x1) / 2 + h * dy, (y0 + y1) / 2 - h * dx), (x1, y1)])
+    return segments
+
+
+def segment_to_edge(pts):
+    vs = [Vector(x, y, 0) for x, y in pts]
+    if len(vs) == 2:
+        return Part.LineSegment(vs[0], vs[1]).toShape()
+    return Part.Arc(vs[0], vs[1], vs[2]).toShape()
+
+
 doc = FreeCAD.newDocument("Convert")
 
-# 1) Import DXF
-importDXF.insert("input.dxf", "Convert")
-doc.recompute()
+# 1) Read DXF entities directly with ezdxf (no Draft objects are materialized)
+msp = ezdxf.readfile("input.dxf").modelspace()
+unsupported = {e.dxftype() for e in msp} - DIRECT_TYPES - IGNORED_TYPES
 
 # 2) Collect closed wires
 wires = []
-for obj in doc.Objects:
-    if hasattr(obj, "Shape"):
-        for w in obj.Shape.Wires:
-            if w.isClosed():
-                wires.append(w)
+if unsupported:
+    # Curves and blocks the direct reader doesn't handle: let importDXF build everything
+    print("Warning: falling back to importDXF for entity types:", ", ".join(sorted(unsupported)))
+    importDXF.insert("input.dxf", "Convert")
+    doc.recompute()
+    for obj in doc.Objects:
+        if hasattr(obj, "Shape"):
+            wires.extend(w for w in obj.Shape.Wires if w.isClosed())
+else:
+    segments = []
+    for e in msp:
+        t = e.dxftype()
+        if t == "LINE":
+            segments.append([(e.dxf.start.x, e.dxf.start.y), (e.dxf.end.x, e.dxf.end.y)])
+        elif t == "ARC":
+            c, r = e.dxf.center, e.dxf.radius
+            a0 = math.radians(e.dxf.start_angle)
+            a1 = math.radians(e.dxf.end_angle)
+            if a1 < a0:
+                a1 += 2 * math.pi
+            segments.append([(c.x + r*math.cos(a), c.y + r*math.sin(a)) for a in (a0, (a0 + a1) / 2, a1)])
+        elif t == "CIRCLE":
+            wires.append(Part.Wire(Part.makeCircle(e.dxf.radius, Vector(*e.dxf.center))))
+        elif t in ("LWPOLYLINE", "POLYLINE"):
+            if t == "LWPOLYLINE":
+                closed, points = e.closed, list(e.get_points("xyb"))
+            else:
+                closed = e.is_closed
+                points = [(v.dxf.location.x, v.dxf.location.y, v.dxf.get("bulge", 0.0)) for v in e.vertices]
+            pieces = bulge_segments(points, closed)
+            if closed and pieces:
+                wires.append(Part.Wire([segment_to_edge(pts) for pts in pieces]))
+            else:
+                segments.extend(pieces)  # Open polylines can still close a loop with other edges
+
+    # Stitch loose segments into closed wires; open chains can't become faces
+    chains, open_segments = stitch_closed_chains(segments, TOL)
+    for chain in chains:
+        wires.append(Part.Wire([segment_to_edge(pts) for pts in chain]))
+    if open_segments:
+        print(f"Warning: {open_segments} segments are not part of a closed loop and were skipped")
 
 # 3) Convert wire → face → solid
-solids = []
-for w in wires:
-    face = Part.Face(w)
-    solid = face.extrude(Vector(0,0,10))
-    pf = doc.addObject("Part::Feature", "Extrusion")
-    pf.Shape = solid
-    solids.append(pf)
-
-doc.recompute()
-
-# 4) Export
-Part.export([s.Shape for s in solids], "output.step")
-doc.saveAs("output.FCStd")
\ No newline at end of file
+# Serial: Part is not reliably thread-safe (see dxf_to_solid.py for a process pool)
+shapes = [Part.Face(w).extrude(Vector(0,0,10)) for w in wires]
+
+# Document objects are only needed for the .FCStd output
+if SAVE_FCSTD:
+    for solid in shapes:
+        pf = doc.addObject("Part::Feature", "Extrusion")
+        pf.Shape = solid
+    doc.recompute()
+
+# 4) Export straight from the shapes (no round trip through the document)
+Part.export(shapes, "output.step")
+if SAVE_FCSTD:
+    doc.saveAs("output.FCStd")
@@ -3,67 +3,340 @@
 # ============================================================================
 
 import cadquery as cq
+import io
+import logging
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional: kernels run as plain NumPy/Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _arc_points_nb(cx, cy, r, a0, a1, segments):
+    """Sample an arc (angles in radians) into a (segments+1, 2) point array"""
+    # Angle-addition recurrence: rotate the start vector by a fixed step
+    # (running complex product) instead of evaluating cos/sin per segment
+    step = (a1 - a0) / segments
+    rotations = np.full(segments + 1, complex(math.cos(step), math.sin(step)))
+    rotations[0] = complex(math.cos(a0), math.sin(a0))
+    unit = np.cumprod(rotations)
+    
+    points = np.empty((segments + 1, 2))
+    points[:, 0] = cx + r * unit.real
+    points[:, 1] = cy + r * unit.imag
+    
+    # Closed-form endpoint so accumulated rotation drift can't open the chain
+    points[segments, 0] = cx + r * math.cos(a1)
+    points[segments, 1] = cy + r * math.sin(a1)
+    return points
+
+
+@njit(cache=True, fastmath=True)
+def _spline_points_nb(control_pts, segments):
+    """Linearly interpolate (N, 2) control points with segments steps per span"""
+    # One broadcast lerp over (span, step, xy) instead of a loop over spans,
+    # so the kernel stays loop-free when Numba is not installed
+    n_spans = control_pts.shape[0] - 1
+    t = np.linspace(0.0, 1.0, segments + 1)[:segments].reshape(1, segments, 1)
+    lo = control_pts[:-1].reshape(n_spans, 1, 2)
+    span = (control_pts[1:] - control_pts[:-1]).reshape(n_spans, 1, 2)
+    
+    points = np.empty((n_spans * segments + 1, 2))
+    points[:-1] = (lo + t * span).reshape(n_spans * segments, 2)
+    points[-1] = control_pts[-1]
+    return points
+
+
+@njit(cache=True)
+def _dedup_nb(xy, tol):
+    """
+    Compact xy in place, dropping points within tol of an earlier kept point
+    Returns the number of kept points (now stored in xy[:count], in order).
+    Spatial hash with cells of 2*tol: each point checks only its 3x3 neighborhood.
+    Buckets are linked lists (head per cell, next per point) to stay Numba-friendly.
+    """
+    n = xy.shape[0]
+    cell = 2.0 * tol
+    tol2 = tol * tol
+    count = 0
+    next_in_cell = np.full(n, -1, dtype=np.int64)
+    heads = {(0, 0): -1}  # seeded so Numba can type the dict; -1 = empty cell
+    
+    for i in range(n):
+        x = xy[i, 0]
+        y = xy[i, 1]
+        bx = int(math.floor(x / cell))
+        by = int(math.floor(y / cell))
+        is_duplicate = False
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                key = (bx + dx, by + dy)
+                j = heads[key] if key in heads else -1
+                while j >= 0:
+                    ddx = x - xy[j, 0]
+                    ddy = y - xy[j, 1]
+                    if ddx * ddx + ddy * ddy <= tol2:
+                        is_duplicate = True
+                        break
+                    j = next_in_cell[j]
+                if is_duplicate:
+                    break
+            if is_duplicate:
+                break
+        
+        # Check and append in the same pass: kept points slide down to xy[count]
+        if not is_duplicate:
+            xy[count, 0] = x
+            xy[count, 1] = y
+            key = (bx, by)
+            next_in_cell[count] = heads[key] if key in heads else -1
+            heads[key] = count
+            count += 1
+    
+    return count
+
+
+@lru_cache(maxsize=4096)
+def _arc_cached(cx, cy, r, a0, a1, segments):
+    """Memoized arc samples; repeated fillets/symbols of identical geometry reuse one array"""
+    points = _arc_points_nb(cx, cy, r, a0, a1, segments)
+    points.flags.writeable = False
+    return points
+
+
+@lru_cache(maxsize=4096)
+def _spline_cached(control_bytes, segments):
+    """Memoized spline samples, keyed on the raw bytes of the (N, 2) control points"""
+    control_pts = np.frombuffer(control_bytes, dtype=np.float64).reshape(-1, 2)
+    points = _spline_points_nb(control_pts, segments)
+    points.flags.writeable = False
+    return points
+
+
+def _emit_line(edge, reverse: bool, coords: array):
+    """Append a LINE edge's endpoints (in chain direction) to a flat x,y buffer"""
+    if reverse:
+        coords.extend(edge.end_point + edge.start_point)
+    else:
+        coords.extend(edge.start_point + edge.end_point)
+
+
+def _emit_arc(edge, reverse: bool, coords: array):
+    """Append an ARC edge's sampled points (in chain direction) to a flat x,y buffer"""
+    sampled = CADBuilder.approximate_arc(edge)
+    coords.frombytes((sampled[::-1] if reverse else sampled).tobytes())
+
+
+def _emit_spline(edge, reverse: bool, coords: array):
+    """Append a SPLINE edge's sampled points (in chain direction) to a flat x,y buffer"""
+    sampled = CADBuilder.approximate_spline(edge)
+    coords.frombytes((sampled[::-1] if reverse else sampled).tobytes())
+
+
+# edge_type -> point emitter for chained profiles
+_POINT_EMITTERS = {
+    'LINE': _emit_line,
+    'ARC': _emit_arc,
+    'SPLINE': _emit_spline,
+}
+
+
+def _circle_outline(profile: Profile) -> Tuple[Optional[tuple], str]:
+    """Outline of a single-CIRCLE profile"""
+    circle = profile.edges[0]
+    return ('circle', (circle.cx, circle.cy, circle.r)), ""
+
+
+def _polyline_outline(profile: Profile) -> Tuple[Optional[tuple], str]:
+    """Outline of a single-POLYLINE profile"""
+    points = profile.edges[0].points
+    count = 0 if points is None else len(points)
+    if count < 3:
+        return None, f"Polyline has insufficient points ({count} < 3)"
+    return ('polyline', points.tolist()), ""
 
 
 class CADBuilder:
     """Handles 3D model construction using CadQuery"""
     
+    # Shared XY plane: Workplane(Plane) reuses it instead of rebuilding the coordinate
+    # system per sketch. The Plane (not a Workplane) is cached because derived
+    # workplanes share their parent's context, i.e. pending wires would leak between sketches.
+    _XY_PLANE = cq.Plane.named("XY")
+    
     @staticmethod
     def point_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
         """Calculate distance between two points"""
-        return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+        return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
     
     @staticmethod
-    def approximate_arc(arc_entity, segments: int = None) -> List[Tuple[float, float]]:
-        """Approximate arc with line segments"""
-        if segments is None:
-            segments = Config.ARC_SEGMENTS
+    def point_distance_sq(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
+        """Calculate squared distance between two points (for tolerance checks)"""
+        dx = p2[0] - p1[0]
+        dy = p2[1] - p1[1]
+        return dx*dx + dy*dy
+    
+    @staticmethod
+    def arc_segments(radius: float, sweep: float) -> int:
+        """Segments needed so chord sag stays within ARC_SAG_TOLERANCE (sweep in radians)"""
+        tol = Config.ARC_SAG_TOLERANCE
+        if 2 * radius <= tol:
+            return Config.ARC_MIN_SEGMENTS
         
-        cx, cy = arc_entity.dxf.center.x, arc_entity.dxf.center.y
-        r = arc_entity.dxf.radius
-        start_angle = math.radians(arc_entity.dxf.start_angle)
-        end_angle = math.radians(arc_entity.dxf.end_angle)
+        # Sag of a chord spanning angle a is r*(1 - cos(a/2)); solve for the largest a
+        max_step = 2 * math.acos(1 - tol / radius)
+        segments = math.ceil(sweep / max_step)
+        return min(max(Config.ARC_MIN_SEGMENTS, segments), Config.ARC_MAX_SEGMENTS)
+    
+    @staticmethod
+    def approximate_arc(edge: GeometricEdge, segments: int = None) -> np.ndarray:
+        """Approximate arc edge with line segments, returned as a read-only (segments+1, 2) array"""
+        cx, cy, r = edge.cx, edge.cy, edge.r
+        start_angle = edge.start_angle_rad
+        end_angle = edge.end_angle_rad
         
         # Handle angle wrap-around
         if end_angle < start_angle:
             end_angle += 2 * math.pi
         
-        points = []
-        for i in range(segments + 1):
-            t = i / segments
-            angle = start_angle + t * (end_angle - start_angle)
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            points.append((x, y))
+        if segments is None:
+            segments = CADBuilder.arc_segments(r, end_angle - start_angle)
         
-        return points
+        # Rounded keys keep float noise from defeating the cache
+        return _arc_cached(round(cx, 10), round(cy, 10), round(r, 10),
+                           round(start_angle, 10), round(end_angle, 10), segments)
     
     @staticmethod
-    def approximate_spline(spline_entity, segments: int = None) -> List[Tuple[float, float]]:
-        """Approximate spline with line segments"""
+    def approximate_spline(edge: GeometricEdge, segments: int = None) -> np.ndarray:
+        """Approximate spline edge with line segments, returned as a read-only (N, 2) array"""
         if segments is None:
             segments = Config.SPLINE_SEGMENTS
         
-        if not hasattr(spline_entity, 'control_points') or len(spline_entity.control_points) < 2:
-            return []
+        if edge.control_points is None or len(edge.control_points) < 2:
+            return np.empty((0, 2))
         
         # Assumption: Simple linear interpolation between control points
         # Note: This is NOT a true spline approximation, just connects control points
-        points = []
-        control_pts = [(p[0], p[1]) for p in spline_entity.control_points]
+        return _spline_cached(edge.control_points.tobytes(), segments)
+    
+    @staticmethod
+    def _dedup_points(points: np.ndarray, tol: float) -> np.ndarray:
+        """
+        Remove points lying within tol of an earlier point, keeping first occurrences
+        Returns a view onto the compacted front of a filtered copy of points
+        """
+        if len(points) == 0:
+            return points
+        
+        # Every joint repeats the previous edge's last point: drop consecutive repeats
+        # in one vector pass so the hash kernel (pure Python without Numba) sees fewer points
+        step = np.diff(points, axis=0)
+        keep = np.empty(len(points), dtype=np.bool_)
+        keep[0] = True
+        keep[1:] = np.einsum('ij,ij->i', step, step) > tol * tol
+        points = points[keep]
+        
+        return points[:_dedup_nb(points, tol)]
+    
+    @staticmethod
+    def _fold_colinear(points: np.ndarray) -> np.ndarray:
+        """Drop vertices of a closed polygon that sit on a straight run between their neighbours"""
+        if len(points) < 4:
+            return points
+        
+        incoming = points - np.roll(points, 1, axis=0)
+        outgoing = np.roll(points, -1, axis=0) - points
+        cross = incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]
+        dot = np.sum(incoming * outgoing, axis=1)
+        
+        # Relative test: only (numerically) exact colinearity, so sampled curves are untouched;
+        # dot > 0 keeps back-tracking spikes
+        scale = np.hypot(incoming[:, 0], incoming[:, 1]) * np.hypot(outgoing[:, 0], outgoing[:, 1])
+        straight = (np.abs(cross) <= 1e-9 * scale) & (dot > 0)
+        return points[~straight]
+    
+    @staticmethod
+    def _profile_outline(profile: Profile) -> Tuple[Optional[tuple], str]:
+        """
+        Reduce profile to plain sketch geometry (picklable, no DXF entities)
+        Returns: (('circle', (cx, cy, r)) or ('polyline', points), error_message)
+        """
+        try:
+            # Kind was fixed when the profile was built: no per-call type probing
+            return _OUTLINE_BUILDERS[profile.primary_kind](profile)
+        except Exception as e:
+            return None, f"Sketch creation failed: {str(e)}"
+    
+    @staticmethod
+    def _chained_outline(profile: Profile) -> Tuple[Optional[tuple], str]:
+        """Outline of a MIXED profile (edges chained by ProfileDetector)"""
+        # Chained lines only: endpoints straight from the line array, no per-edge emit
+        if len(profile.edges) > 1 and len(profile.line_order) == len(profile.edges):
+            return CADBuilder._finish_outline(profile.line_endpoints.reshape(-1, 2))
         
-        for i in range(len(control_pts) - 1):
-            p1 = control_pts[i]
-            p2 = control_pts[i + 1]
+        # Arcs of one circle covering 360° (e.g. two half-circles) are a circle
+        if len(profile.edges) > 1:
+            circle = arc_circle(profile.edges)
+            if circle is not None:
+                return ('circle', circle), ""
+        
+        # Chained edges (lines, arcs, splines)
+        if len(profile.edges) > 1:
+            # Bind the emitter table once so the edge loop only touches locals
+            emitters = _POINT_EMITTERS
+            
+            # Flat x,y coordinate buffer: no per-point tuples or per-edge arrays
+            coords = array('d')
+            
+            for edge, reverse in zip(profile.edges, profile.reversed_edges):
+                emit = emitters.get(edge.edge_type)
+                if emit is not None:
+                    emit(edge, reverse, coords)
             
-            for j in range(segments):
-                t = j / segments
-                x = p1[0] + t * (p2[0] - p1[0])
-                y = p1[1] + t * (p2[1] - p1[1])
-                points.append((x, y))
+            return CADBuilder._finish_outline(np.frombuffer(coords, dtype=np.float64).reshape(-1, 2))
+        
+        return None, f"Unsupported profile configuration (edges={len(profile.edges)})"
+    
+    @staticmethod
+    def _finish_outline(points: np.ndarray) -> Tuple[Optional[tuple], str]:
+        """
+        Polyline outline from a chained profile's raw points (joints and the closing
+        point repeated); lines-only and mixed profiles share it so they reduce alike
+        """
+        # Remove duplicate points across the whole profile, then collapse straight runs
+        points = CADBuilder._dedup_points(points, Config.POINT_COINCIDENCE_TOLERANCE)
+        points = CADBuilder._fold_colinear(points)
+        if len(points) < 3:
+            return None, f"Insufficient unique points after chaining ({len(points)} < 3)"
+        
+        return ('polyline', points.tolist()), ""
+    
+    @staticmethod
+    def _sketch_from_outline(outline: tuple) -> cq.Workplane:
+        """Build CadQuery sketch from an outline produced by _profile_outline"""
+        kind, data = outline
+        if kind == 'circle':
+            cx, cy, r = data
+            return cq.Workplane(CADBuilder._XY_PLANE).center(cx, cy).circle(r)
         
-        points.append(control_pts[-1])
-        return points
+        try:
+            # Whole outline in one BRepBuilderAPI_MakePolygon call instead of an edge per point
+            wire = cq.Wire.makePolygon(data, close=True)
+            return cq.Workplane(CADBuilder._XY_PLANE).add(wire).toPending()
+        except Exception:
+            return cq.Workplane(CADBuilder._XY_PLANE).polyline(data).close()
     
     @staticmethod
     def create_sketch_from_profile(profile: Profile) -> Tuple[Optional[cq.Workplane], str]:
@@ -71,56 +344,92 @@ class CADBuilder:
         Convert profile to CadQuery sketch
         Returns: (sketch, error_message)
         """
+        outline, error = CADBuilder._profile_outline(profile)
+        if outline is None:
+            return None, error
+        
         try:
-            # Single circle
-            if len(profile.edges) == 1 and profile.edges[0].edge_type == 'CIRCLE':
-                circle = profile.edges[0].entity
-                cx, cy = circle.dxf.center.x, circle.dxf.center.y
-                r = circle.dxf.radius
-                return cq.Workplane("XY").center(cx, cy).circle(r), ""
+            return CADBuilder._sketch_from_outline(outline), ""
+        except Exception as e:
+            return None, f"Sketch creation failed: {str(e)}"
+    
+    @staticmethod
+    def _prepare_feature_solids(features: List[FeatureInfo]) -> List[Tuple[Optional[object], str]]:
+        """
+        Build the extruded tool solid for each cut/add feature
+        Independent features are built in a process pool once there are at least
+        Config.PARALLEL_FEATURE_THRESHOLD of them; solids travel back as BREP bytes.
+        Returns: [(solid, error_message)] aligned with features
+        """
+        prepared = [(None, "")] * len(features)
+        jobs = []
+        
+        for i, feature in enumerate(features):
+            # Validate feature profile
+            is_closed, closure_msg = feature.profile.validate_closure()
+            if not is_closed and Config.ENABLE_STRICT_VALIDATION:
+                prepared[i] = (None, closure_msg)
+                continue
             
-            # Single polyline
-            if len(profile.edges) == 1 and profile.edges[0].edge_type == 'POLYLINE':
-                pline = profile.edges[0].entity
-                points = [(v[0], v[1]) for v in pline.get_points()]
-                if len(points) < 3:
-                    return None, f"Polyline has insufficient points ({len(points)} < 3)"
-                return cq.Workplane("XY").polyline(points).close(), ""
+            if feature.operation not in ('cut', 'add'):
+                prepared[i] = (None, f"Unknown operation '{feature.operation}'")
+                continue
             
-            # Chained edges (lines, arcs, splines)
-            if len(profile.edges) > 1:
-                points = []
-                
-                # Collect points from all edges
-                for edge in profile.edges:
-                    if edge.edge_type == 'LINE':
-                        if not points or CADBuilder.point_distance(points[-1], edge.start_point) > Config.POINT_COINCIDENCE_TOLERANCE:
-                            points.append(edge.start_point)
-                        points.append(edge.end_point)
-                    
-                    elif edge.edge_type == 'ARC':
-                        arc_points = CADBuilder.approximate_arc(edge.entity)
-                        points.extend(arc_points)
-                    
-                    elif edge.edge_type == 'SPLINE':
-                        spline_points = CADBuilder.approximate_spline(edge.entity)
-                        points.extend(spline_points)
-                
-                # Remove duplicate consecutive points
-                unique_points = []
-                for p in points:
-                    if not unique_points or CADBuilder.point_distance(p, unique_points[-1]) > Config.POINT_COINCIDENCE_TOLERANCE:
-                        unique_points.append(p)
-                
-                if len(unique_points) < 3:
-                    return None, f"Insufficient unique points after chaining ({len(unique_points)} < 3)"
-                
-                return cq.Workplane("XY").polyline(unique_points).close(), ""
+            outline, error = CADBuilder._profile_outline(feature.profile)
+            if outline is None:
+                prepared[i] = (None, error)
+                continue
             
-            return None, f"Unsupported profile configuration (edges={len(profile.edges)})"
+            jobs.append((i, (outline, feature.depth)))
         
-        except Exception as e:
-            return None, f"Sketch creation failed: {str(e)}"
+        if len(jobs) >= Config.PARALLEL_FEATURE_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                results = pool.map(_extrude_outline_brep, [job for _, job in jobs])
+                for (i, _), (brep, error) in zip(jobs, results):
+                    if brep is None:
+                        prepared[i] = (None, error)
+                    else:
+                        prepared[i] = (cq.Shape.importBrep(io.BytesIO(brep)), "")
+        else:
+            for i, (outline, depth) in jobs:
+                try:
+                    prepared[i] = (CADBuilder._sketch_from_outline(outline).extrude(depth).val(), "")
+                except Exception as e:
+                    prepared[i] = (None, str(e))
+        
+        return prepared
+    
+    @staticmethod
+    def _apply_tools(result: cq.Workplane, tools: List[Tuple[int, FeatureInfo, object]],
+                     operation: str, report: List[Tuple[int, str, float, str]]) -> cq.Workplane:
+        """
+        Cut or union all tool solids with a single boolean against one compound
+        Falls back to per-feature booleans if the batched operation fails, so only
+        the offending feature gets skipped. Outcomes are appended to report.
+        """
+        if not tools:
+            return result
+        
+        try:
+            compound = cq.Compound.makeCompound([solid for _, _, solid in tools])
+            result = result.cut(compound) if operation == 'cut' else result.union(compound)
+            for i, feature, _ in tools:
+                log.debug("  ✓ %s feature %d: depth=%smm", operation, i, feature.depth)
+                report.append((i, operation, feature.depth, "ok"))
+            return result
+        except Exception:
+            log.debug("  Batched %s failed, applying features one by one", operation)
+        
+        for i, feature, solid in tools:
+            try:
+                result = result.cut(solid) if operation == 'cut' else result.union(solid)
+                log.debug("  ✓ %s feature %d: depth=%smm", operation, i, feature.depth)
+                report.append((i, operation, feature.depth, "ok"))
+            except Exception as e:
+                log.debug("  ⚠ Skipping feature %d: %s", i, e)
+                report.append((i, operation, feature.depth, str(e)))
+        
+        return result
     
     @staticmethod
     def validate_revolve_inputs(feature: FeatureInfo) -> Tuple[bool, str]:
@@ -150,7 +459,7 @@ class CADBuilder:
         Build complete 3D model from features
         Returns: (solid, error_message)
         """
-        print("\nBuilding 3D model...")
+        log.debug("Building 3D model...")
         
         if not features:
             return None, "No features to build"
@@ -161,7 +470,7 @@ class CADBuilder:
         is_closed, closure_msg = base_feature.profile.validate_closure()
         if not is_closed and Config.ENABLE_STRICT_VALIDATION:
             error = f"Base feature validation failed: {closure_msg}"
-            print(f"✗ {error}")
+            log.error("✗ %s", error)
             return None, error
         
         try:
@@ -174,13 +483,13 @@ class CADBuilder:
                     return None, f"Extrude failed: {error}"
                 
                 result = sketch.extrude(base_feature.depth)
-                print(f"  ✓ Extruded base: {base_feature.depth}mm")
+                log.debug("  ✓ Extruded base: %smm", base_feature.depth)
             
             elif base_feature.operation == 'revolve':
                 # Validate revolve inputs
                 is_valid, error_msg = CADBuilder.validate_revolve_inputs(base_feature)
                 if not is_valid:
-                    print(f"✗ {error_msg}")
+                    log.error("✗ %s", error_msg)
                     return None, error_msg
                 
                 sketch, error = CADBuilder.create_sketch_from_profile(base_feature.profile)
@@ -193,72 +502,77 @@ class CADBuilder:
                     ax, ay = base_feature.axis
                     # Revolve around vertical axis through (ax, ay)
                     result = sketch.revolve(base_feature.angle, (ax, ay, 0), (ax, ay, 1))
-                    print(f"  ✓ Revolved base: {base_feature.angle}° around axis at ({ax}, {ay})")
+                    log.debug("  ✓ Revolved base: %s° around axis at (%s, %s)", base_feature.angle, ax, ay)
                 else:
                     # Default: revolve around Y-axis
                     result = sketch.revolve(base_feature.angle)
-                    print(f"  ✓ Revolved base: {base_feature.angle}° around Y-axis")
+                    log.debug("  ✓ Revolved base: %s° around Y-axis", base_feature.angle)
             
             elif base_feature.operation == 'loft':
                 error = "Loft operation not fully implemented yet. Requires multi-plane profile setup and advanced CadQuery operations."
-                print(f"✗ {error}")
+                log.error("✗ %s", error)
                 return None, error
             
             elif base_feature.operation == 'sweep':
                 error = "Sweep operation not fully implemented yet. Requires 3D path curve definition and advanced CadQuery operations."
-                print(f"✗ {error}")
+                log.error("✗ %s", error)
                 return None, error
             
             else:
                 error = f"Unknown operation: {base_feature.operation}"
-                print(f"✗ {error}")
+                log.error("✗ %s", error)
                 return None, error
             
             if result is None:
                 return None, "Failed to create base feature"
             
-            # Apply additional features (cuts/additions)
-            for i, feature in enumerate(features[1:], 1):
-                try:
-                    # Validate feature profile
-                    is_closed, closure_msg = feature.profile.validate_closure()
-                    if not is_closed and Config.ENABLE_STRICT_VALIDATION:
-                        print(f"  ⚠ Skipping feature {i}: {closure_msg}")
-                        continue
-                    
-                    if feature.operation == 'cut':
-                        cut_sketch, error = CADBuilder.create_sketch_from_profile(feature.profile)
-                        if cut_sketch is None:
-                            print(f"  ⚠ Skipping feature {i}: {error}")
-                            continue
-                        
-                        cut_solid = cut_sketch.extrude(feature.depth)
-                        result = result.cut(cut_solid)
-                        print(f"  ✓ Cut feature {i}: depth={feature.depth}mm")
-                    
-                    elif feature.operation == 'add':
-                        add_sketch, error = CADBuilder.create_sketch_from_profile(feature.profile)
-                        if add_sketch is None:
-                            print(f"  ⚠ Skipping feature {i}: {error}")
-                            continue
-                        
-                        add_solid = add_sketch.extrude(feature.depth)
-                        result = result.union(add_solid)
-                        print(f"  ✓ Added feature {i}: depth={feature.depth}mm")
-                    
-                    else:
-                        print(f"  ⚠ Skipping feature {i}: Unknown operation '{feature.operation}'")
-                
-                except Exception as e:
-                    print(f"  ⚠ Skipping feature {i}: {str(e)}")
+            # Apply additional features (cuts/additions); tool solids are built up front
+            prepared = CADBuilder._prepare_feature_solids(features[1:])
+            report = []  # (feature index, operation, depth, "ok" or skip reason)
+            add_tools = []
+            cut_tools = []
+            for i, (feature, (solid, error)) in enumerate(zip(features[1:], prepared), 1):
+                if solid is None:
+                    log.debug("  ⚠ Skipping feature %d: %s", i, error)
+                    report.append((i, feature.operation, feature.depth, error))
+                elif feature.operation == 'cut':
+                    cut_tools.append((i, feature, solid))
+                else:
+                    add_tools.append((i, feature, solid))
+            
+            # One N-ary boolean per operation instead of rebuilding the result per feature
+            result = CADBuilder._apply_tools(result, add_tools, 'add', report)
+            result = CADBuilder._apply_tools(result, cut_tools, 'cut', report)
             
-            print("✓ 3D model built successfully")
+            if log.isEnabledFor(logging.INFO):
+                skipped = [(i, status) for i, _, _, status in report if status != "ok"]
+                log.info("✓ 3D model built successfully (%d features applied, %d skipped)",
+                         len(report) - len(skipped), len(skipped))
+                for i, status in sorted(skipped):
+                    log.info("  ⚠ Skipped feature %d: %s", i, status)
             return result, ""
         
         except Exception as e:
             error = f"Model building failed: {str(e)}"
-            print(f"✗ {error}")
-            import traceback
-            traceback.print_exc()
+            log.error("✗ %s", error, exc_info=True)
             return None, error
 
+
+# Profile.primary_kind -> outline builder
+_OUTLINE_BUILDERS = {
+    'CIRCLE': _circle_outline,
+    'POLYLINE': _polyline_outline,
+    'MIXED': CADBuilder._chained_outline,
+}
+
+
+def _extrude_outline_brep(job: Tuple[tuple, float]) -> Tuple[Optional[bytes], str]:
+    """Process-pool worker: extrude an outline and return the solid as BREP bytes"""
+    outline, depth = job
+    try:
+        solid = CADBuilder._sketch_from_outline(outline).extrude(depth).val()
+        buffer = io.BytesIO()
+        solid.exportBrep(buffer)
+        return buffer.getvalue(), ""
+    except Exception as e:
+        return None, str(e)
@@ -10,8 +10,16 @@ class Config:
     PROFILE_CLOSURE_TOLERANCE = 0.01  # mm - to check if profile is closed
     POINT_COINCIDENCE_TOLERANCE = 0.01  # mm - to check if two points are same
     
+    # Squared tolerances for distance tests (compare squared distances, no sqrt);
+    # derived from the values above - override them together
+    EDGE_CONNECTION_TOLERANCE_SQ = EDGE_CONNECTION_TOLERANCE ** 2
+    PROFILE_CLOSURE_TOLERANCE_SQ = PROFILE_CLOSURE_TOLERANCE ** 2
+    POINT_COINCIDENCE_TOLERANCE_SQ = POINT_COINCIDENCE_TOLERANCE ** 2
+    
     # Approximation Settings
-    ARC_SEGMENTS = 16  # Number of segments to approximate arcs
+    ARC_SAG_TOLERANCE = 0.05  # mm - max chord sag when sampling arcs into sketch points
+    ARC_MIN_SEGMENTS = 2  # Arc segments are chosen to keep chord sag within ARC_SAG_TOLERANCE,
+    ARC_MAX_SEGMENTS = 64  # clamped to this range
     SPLINE_SEGMENTS = 20  # Number of segments to approximate splines
     
     # Default Values
@@ -21,5 +29,13 @@ class Config:
     # Feature Detection
     MIN_PROFILE_EDGES = 3  # Minimum edges to form a valid profile
     
+    # Performance Settings
+    PARALLEL_FEATURE_THRESHOLD = 8  # Min cut/add features before solids are built in a process pool
+    PARALLEL_CHAIN_THRESHOLD = 50000  # Min edges before components are chained in a process pool (no Numba)
+    
+    # Cache Settings
+    ENABLE_GEOMETRY_CACHE = False  # Opt-in: reuse extracted edges while the DXF is unchanged (path, mtime, size)
+    GEOMETRY_CACHE_DIR = '~/.cache/cad_automation'  # One .npz per cached DXF path (older versions are pruned)
+    
     # Validation Settings
     ENABLE_STRICT_VALIDATION = True  # Fail fast on invalid geometry
\ No newline at end of file
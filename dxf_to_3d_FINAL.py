@@ -80,12 +80,12 @@ class GeometricEdge:
         
         dx1 = point[0] - self.start_point[0]
         dy1 = point[1] - self.start_point[1]
-        dist_start = math.sqrt(dx1*dx1 + dy1*dy1)
+        dist_start = math.hypot(dx1, dy1)
         
         if self.end_point:
             dx2 = point[0] - self.end_point[0]
             dy2 = point[1] - self.end_point[1]
-            dist_end = math.sqrt(dx2*dx2 + dy2*dy2)
+            dist_end = math.hypot(dx2, dy2)
             return min(dist_start, dist_end)
         
         return dist_start
@@ -93,13 +93,22 @@ class GeometricEdge:
 
 class Profile:
     """Represents a closed 2D profile (contour)"""
-    def __init__(self, edges: List[GeometricEdge], is_outer: bool = True):
+    def __init__(self, edges: List[GeometricEdge], is_outer: bool = True,
+                 reversed_edges: Optional[List[bool]] = None):
         self.edges = edges
         self.is_outer = is_outer
+        self.reversed_edges = reversed_edges or [False] * len(edges)  # Edge walked end -> start
         self.area = 0.0
         self.centroid = (0.0, 0.0)
         self.bounding_box = None
         self.is_closed = False
+    
+    def oriented_endpoints(self, i: int) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+        """(start, end) of edge i in the direction the chain walks it"""
+        edge = self.edges[i]
+        if self.reversed_edges[i]:
+            return edge.end_point, edge.start_point
+        return edge.start_point, edge.end_point
         
     def calculate_properties(self):
         """Calculate area and centroid for profile classification"""
@@ -107,32 +116,34 @@ class Profile:
             return
         
         points = []
-        for edge in self.edges:
-            if edge.start_point:
-                points.append(edge.start_point)
-            if edge.end_point and edge.end_point != edge.start_point:
-                points.append(edge.end_point)
-        
-        if len(points) >= 3:
-            # Calculate area using shoelace formula
+        for i in range(len(self.edges)):
+            start, end = self.oriented_endpoints(i)
+            if start:
+                points.append(start)
+            if end and end != start:
+                points.append(end)
+        
+        n = len(points)
+        if n >= 3:
+            # One pass over the points: shoelace area and centroid sums together,
+            # the last point wrapping around to the first
+            x0, y0 = points[0]
+            px, py = x0, y0
             area = 0.0
-            for i in range(len(points)):
-                j = (i + 1) % len(points)
-                area += points[i][0] * points[j][1]
-                area -= points[j][0] * points[i][1]
+            sx, sy = x0, y0
+            for x, y in points[1:]:
+                area += px * y - x * py
+                sx += x
+                sy += y
+                px, py = x, y
+            area += px * y0 - x0 * py
             self.area = abs(area) / 2.0
+            self.centroid = (sx / n, sy / n)
             
-            # Calculate centroid
-            cx = sum(p[0] for p in points) / len(points)
-            cy = sum(p[1] for p in points) / len(points)
-            self.centroid = (cx, cy)
-            
-            # Check if closed
-            if len(points) > 0:
-                first = points[0]
-                last = points[-1]
-                dist = math.sqrt((last[0]-first[0])**2 + (last[1]-first[1])**2)
-                self.is_closed = dist < 0.01  # Tolerance
+            # Check if closed (last point back at the first)
+            dx = px - x0
+            dy = py - y0
+            self.is_closed = dx*dx + dy*dy < 0.01 * 0.01  # Tolerance
 
 
 class FeatureInfo:
@@ -298,58 +309,82 @@ class DXFTo3DConverter:
                 used_edges.add(i)
                 print(f"  Found closed {edge.edge_type} profile")
         
-        # Chain remaining edges (lines, arcs, splines)
-        remaining_edges = [
-            (i, edge) for i, edge in enumerate(self.geometric_edges) 
-            if i not in used_edges
-        ]
+        # Chain remaining edges (lines, arcs, splines). Endpoints are bucketed in a grid
+        # of tolerance-sized cells, so each step only probes the 3x3 cells around the
+        # current end; chained edges are removed from their cells.
+        edges = self.geometric_edges
+        remaining = [i for i in range(len(edges)) if i not in used_edges]
         
-        while remaining_edges:
-            # Start a new chain
-            chain = []
-            idx, start_edge = remaining_edges.pop(0)
-            chain.append(start_edge)
+        tol2 = self.connection_tolerance * self.connection_tolerance
+        cell = self.connection_tolerance or 1.0  # Zero tolerance: nothing connects anyway
+        
+        def cell_of(point):
+            return (math.floor(point[0] / cell), math.floor(point[1] / cell))
+        
+        grid = {}
+        for i in remaining:
+            for point in (edges[i].start_point, edges[i].end_point):
+                if point:
+                    grid.setdefault(cell_of(point), set()).add(i)
+        
+        def take(idx):
             used_edges.add(idx)
+            for point in (edges[idx].start_point, edges[idx].end_point):
+                if point:
+                    grid[cell_of(point)].discard(idx)
+        
+        for first in remaining:
+            if first in used_edges:
+                continue
+            
+            # Start a new chain
+            start_edge = edges[first]
+            chain = [start_edge]
+            reversed_edges = [False]
+            take(first)
             
             # Try to find connecting edges
             current_end = start_edge.end_point
-            max_iterations = len(remaining_edges) + 10
-            iterations = 0
             
-            while iterations < max_iterations:
-                iterations += 1
-                found_connection = False
-                
-                for i, (idx, edge) in enumerate(remaining_edges):
-                    if idx in used_edges:
-                        continue
-                    
-                    # Check if this edge connects to current end
-                    dist_to_start = edge.distance_to_point(current_end) if edge.start_point else float('inf')
-                    dist_to_end = edge.distance_to_point(current_end) if edge.end_point else float('inf')
-                    
-                    if dist_to_start < self.connection_tolerance:
-                        chain.append(edge)
-                        used_edges.add(idx)
-                        remaining_edges.pop(i)
-                        current_end = edge.end_point
-                        found_connection = True
-                        break
-                    elif dist_to_end < self.connection_tolerance:
-                        # Reverse the edge
-                        chain.append(edge)
-                        used_edges.add(idx)
-                        remaining_edges.pop(i)
-                        current_end = edge.start_point
-                        found_connection = True
-                        break
+            while current_end:
+                # Lowest-index edge touching the current end: its start (walk it
+                # forward), else its end (walk it reversed); squared distances, no sqrt
+                cx, cy = current_end
+                gx, gy = cell_of(current_end)
+                best = None
+                best_reversed = False
+                for i in (gx - 1, gx, gx + 1):
+                    for j in (gy - 1, gy, gy + 1):
+                        for idx in grid.get((i, j), ()):
+                            if best is not None and idx >= best:
+                                continue
+                            edge = edges[idx]
+                            s2 = e2 = float('inf')
+                            if edge.start_point:
+                                sdx = edge.start_point[0] - cx
+                                sdy = edge.start_point[1] - cy
+                                s2 = sdx*sdx + sdy*sdy
+                            if s2 >= tol2 and edge.end_point:
+                                edx = edge.end_point[0] - cx
+                                edy = edge.end_point[1] - cy
+                                e2 = edx*edx + edy*edy
+                            if s2 < tol2 or e2 < tol2:
+                                best = idx
+                                best_reversed = s2 >= tol2
                 
-                if not found_connection:
+                if best is None:
                     break
+                
+                edge = edges[best]
+                chain.append(edge)
+                reversed_edges.append(best_reversed)
+                take(best)
+                # Connected at its end: the edge is walked reversed
+                current_end = edge.start_point if best_reversed else edge.end_point
             
             # Check if chain is closed
             if len(chain) >= 3:
-                profile = Profile(chain, is_outer=True)
+                profile = Profile(chain, is_outer=True, reversed_edges=reversed_edges)
                 profile.calculate_properties()
                 
                 if profile.is_closed or len(chain) >= 3:
@@ -544,22 +579,23 @@ class DXFTo3DConverter:
             if len(profile.edges) > 1:
                 points = []
                 
-                # Collect all points from edges
-                for edge in profile.edges:
+                # Collect all points from edges, each in the direction the chain walks it
+                for i, (edge, reverse) in enumerate(zip(profile.edges, profile.reversed_edges)):
                     if edge.edge_type == 'LINE':
-                        if not points or points[-1] != edge.start_point:
-                            points.append(edge.start_point)
-                        points.append(edge.end_point)
+                        start, end = profile.oriented_endpoints(i)
+                        if not points or points[-1] != start:
+                            points.append(start)
+                        points.append(end)
                     
                     elif edge.edge_type == 'ARC':
                         # Approximate arc with line segments
                         arc_points = self.approximate_arc(edge.entity)
-                        points.extend(arc_points)
+                        points.extend(reversed(arc_points) if reverse else arc_points)
                     
                     elif edge.edge_type == 'SPLINE':
                         # Approximate spline
                         spline_points = self.approximate_spline(edge.entity)
-                        points.extend(spline_points)
+                        points.extend(reversed(spline_points) if reverse else spline_points)
                 
                 # Remove duplicates while preserving order
                 unique_points = []
@@ -621,7 +657,7 @@ class DXFTo3DConverter:
     
     def point_distance(self, p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
         """Calculate distance between two points"""
-        return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+        return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
     
     def create_revolve_feature(self, feature: FeatureInfo) -> Optional[cq.Workplane]:
         """Create revolved feature"""
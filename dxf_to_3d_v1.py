@@ -3,7 +3,9 @@ DXF to 3D STEP Converter
 Annotation-driven with rule-based fallback approach
 
 Requirements:
-pip install ezdxf cadquery
+pip install ezdxf cadquery numpy
+Optional: pip install rtree (faster outer/inner profile classification)
+Optional: pip install numba (faster area/centroid for very large polylines)
 
 Usage:
     converter = DXFTo3DConverter('input_sketch.dxf')
@@ -12,49 +14,193 @@ Usage:
 """
 
 import ezdxf
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.math import Vec3
 import cadquery as cq
 from typing import List, Dict, Tuple, Optional
+import logging
 import re
 import math
+import numpy as np
+
+try:
+    from rtree import index as rtree_index  # Optional: R-tree prefilter for containment
+except ImportError:
+    rtree_index = None
+
+try:
+    from numba import njit  # Optional: fused shoelace kernel for large profiles
+except ImportError:
+    njit = None
+
+log = logging.getLogger(__name__)
+
+# Annotation pattern, compiled once: one scan per TEXT finds depth and operation
+# keywords (IGNORECASE instead of an upper() copy; DXF annotation text is plain ASCII)
+_RE_ANNOTATION = re.compile(
+    r'(?:DEPTH|D|EXTRUDE)[\s:=]+(?P<depth>\d+\.?\d*)|(?P<op>CUT|HOLE|BOSS|PROTRUSION|BASE)',
+    re.ASCII | re.IGNORECASE)
+
+# Operation keyword -> operation, and the order in which operations win
+_OP_KEYWORDS = {'CUT': 'cut', 'HOLE': 'cut', 'BOSS': 'add', 'PROTRUSION': 'add', 'BASE': 'base'}
+_OP_PRECEDENCE = ('cut', 'add', 'base')
+
+
+# Entity kind codes used by EntityArrays
+KIND_LINE, KIND_CIRCLE, KIND_ARC, KIND_LWPOLY, KIND_SPLINE = range(5)
+
+# Shared XY plane for every sketch: Workplane(Plane) reuses it instead of rebuilding
+# the coordinate system. The Plane (not a Workplane) is cached because workplanes
+# derived from one share its context, so pending wires would leak between sketches.
+_XY_PLANE = cq.Plane.named("XY")
+
+# Profile kind codes (index into _SKETCH_BUILDERS), set once by identify_profiles
+PROFILE_CIRCLE, PROFILE_LWPOLY, PROFILE_MIXED = range(3)
+
+
+class EntityArrays:
+    """Geometry of the extracted entities as parallel NumPy arrays (read once from ezdxf)"""
+    def __init__(self, lines: List, arcs: List, circles: List, polylines: List, splines: List):
+        self.line_starts = np.array([(e.dxf.start.x, e.dxf.start.y) for e in lines],
+                                    dtype=np.float64).reshape(-1, 2)
+        self.line_ends = np.array([(e.dxf.end.x, e.dxf.end.y) for e in lines],
+                                  dtype=np.float64).reshape(-1, 2)
+        self.circle_centers = np.array([(e.dxf.center.x, e.dxf.center.y) for e in circles],
+                                       dtype=np.float64).reshape(-1, 2)
+        self.circle_radii = np.array([e.dxf.radius for e in circles], dtype=np.float64)
+        self.polyline_pts = [np.asarray(e.get_points('xy'), dtype=np.float64).reshape(-1, 2)
+                             for e in polylines]
+        
+        # Global entity id -> kind code and index within that kind's arrays
+        # (ids run over lines, arcs, circles, polylines, splines in that order)
+        groups = ((KIND_LINE, lines), (KIND_ARC, arcs), (KIND_CIRCLE, circles),
+                  (KIND_LWPOLY, polylines), (KIND_SPLINE, splines))
+        self.entity_kind = np.concatenate(
+            [np.full(len(group), kind, dtype=np.int8) for kind, group in groups])
+        self.entity_index = np.concatenate(
+            [np.arange(len(group), dtype=np.int32) for _, group in groups])
+        self.offsets = {}
+        start = 0
+        for kind, group in groups:
+            self.offsets[kind] = start
+            start += len(group)
+
+
+# Profiles with more vertices than this use the Numba shoelace kernel (if installed)
+NUMBA_SHOELACE_MIN_POINTS = 4096
+
+# Profiles per block of the broadcast bounding-box enclosure test (without rtree)
+CONTAINMENT_BLOCK = 512
+
+
+def _shoelace_sums(pts: np.ndarray) -> Tuple[float, float, float]:
+    """Signed area and centroid moment sums of a closed (N, 2) vertex ring in one pass"""
+    n = pts.shape[0]
+    a = 0.0
+    sx = 0.0
+    sy = 0.0
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        xi, yi = pts[i, 0], pts[i, 1]
+        xj, yj = pts[j, 0], pts[j, 1]
+        c = xi * yj - xj * yi
+        a += c
+        sx += (xi + xj) * c
+        sy += (yi + yj) * c
+    return 0.5 * a, sx, sy
+
+
+if njit is not None:
+    _shoelace_sums = njit(cache=True, fastmath=True)(_shoelace_sums)
+
+
+def _point_in_polygon(x: float, y: float, poly: np.ndarray) -> bool:
+    """Even-odd ray casting of (x, y) against an (N, 2) closed vertex ring"""
+    px, py = poly[:, 0], poly[:, 1]
+    qx, qy = np.roll(px, -1), np.roll(py, -1)
+    spans = (py > y) != (qy > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = px + (y - py) * (qx - px) / (qy - py)
+    return bool(np.count_nonzero(spans & (x < x_cross)) % 2)
+
+
+class PointBuffer:
+    """Growable (N, 2) float64 scratch buffer, shared across Profile.calculate_properties calls"""
+    
+    def __init__(self):
+        self._buf = np.empty((0, 2), dtype=np.float64)
+    
+    def view(self, n: int) -> np.ndarray:
+        """(n, 2) view of the buffer, grown by doubling when too small (contents undefined)"""
+        if self._buf.shape[0] < n:
+            self._buf = np.empty((max(n, 2 * self._buf.shape[0]), 2), dtype=np.float64)
+        return self._buf[:n]
 
 
 class Profile:
     """Represents a closed 2D profile (contour)"""
-    def __init__(self, edges: List, is_outer: bool = True):
+    
+    def __init__(self, edges: List, is_outer: bool = True,
+                 geometry: Optional[EntityArrays] = None, entity_ids: Optional[List[int]] = None,
+                 kind: int = PROFILE_MIXED):
         self.edges = edges
         self.is_outer = is_outer
+        self.kind = kind  # PROFILE_CIRCLE, PROFILE_LWPOLY or PROFILE_MIXED
         self.area = 0.0
         self.centroid = (0.0, 0.0)
         self.bounding_box = None
+        self.geometry = geometry  # Shared SoA store the entity ids point into
+        self.entity_ids = np.asarray(entity_ids if entity_ids is not None else [], dtype=np.int32)
         
-    def calculate_properties(self):
-        """Calculate area and centroid for profile classification"""
+    def calculate_properties(self, scratch: Optional[PointBuffer] = None):
+        """Calculate area and centroid for profile classification (scratch: reused point buffer)"""
         # Simplified calculation - in production, use proper polygon algorithms
-        if not self.edges:
+        if not self.edges or self.geometry is None:
             return
         
-        points = []
-        for edge in self.edges:
-            if hasattr(edge, 'dxf'):
-                if edge.dxftype() == 'LINE':
-                    points.append((edge.dxf.start.x, edge.dxf.start.y))
-                elif edge.dxftype() == 'CIRCLE':
-                    points.append((edge.dxf.center.x, edge.dxf.center.y))
-        
-        if len(points) >= 3:
-            # Calculate approximate area using shoelace formula
-            area = 0.0
-            for i in range(len(points)):
-                j = (i + 1) % len(points)
-                area += points[i][0] * points[j][1]
-                area -= points[j][0] * points[i][1]
-            self.area = abs(area) / 2.0
+        # Gather line starts, circle centers and polyline vertices in edge order
+        # straight from the SoA arrays (one row per line/circle, N per polyline)
+        g = self.geometry
+        kinds = g.entity_kind[self.entity_ids]
+        local = g.entity_index[self.entity_ids]
+        is_line = kinds == KIND_LINE
+        is_circle = kinds == KIND_CIRCLE
+        is_poly = kinds == KIND_LWPOLY
+        
+        sizes = (is_line | is_circle).astype(np.intp)
+        sizes[is_poly] = [len(g.polyline_pts[i]) for i in local[is_poly]]
+        offsets = np.cumsum(sizes) - sizes
+        
+        n_pts = int(sizes.sum())
+        pts = scratch.view(n_pts) if scratch is not None else np.empty((n_pts, 2), dtype=np.float64)
+        pts[offsets[is_line]] = g.line_starts[local[is_line]]
+        pts[offsets[is_circle]] = g.circle_centers[local[is_circle]]
+        for start, i in zip(offsets[is_poly], local[is_poly]):
+            vertices = g.polyline_pts[i]
+            pts[start:start + len(vertices)] = vertices
+        
+        if len(pts) >= 3:
+            x, y = pts[:, 0], pts[:, 1]
+            
+            if njit is not None and len(pts) > NUMBA_SHOELACE_MIN_POINTS:
+                # Large rings: one streaming pass, no rolled/temporary arrays
+                signed_area, sx, sy = _shoelace_sums(pts)  # Contiguous buffer rows, no column copies
+            else:
+                rx, ry = np.roll(x, -1), np.roll(y, -1)
+                
+                # Shoelace formula: per-vertex cross terms, summed once
+                cross = x * ry - rx * y
+                signed_area = 0.5 * cross.sum()
+                sx = ((x + rx) * cross).sum()
+                sy = ((y + ry) * cross).sum()
+            self.area = float(abs(signed_area))
             
-            # Calculate centroid
-            cx = sum(p[0] for p in points) / len(points)
-            cy = sum(p[1] for p in points) / len(points)
-            self.centroid = (cx, cy)
+            # Polygon centroid (area-weighted); vertex mean only for degenerate polygons
+            if signed_area != 0.0:
+                self.centroid = (float(sx / (6.0 * signed_area)), float(sy / (6.0 * signed_area)))
+            else:
+                self.centroid = (float(x.mean()), float(y.mean()))
 
 
 class FeatureInfo:
@@ -68,9 +214,41 @@ class FeatureInfo:
         self.direction = 'normal'  # 'normal' or custom vector
 
 
+# Operation codes used by FeatureTable
+OP_EXTRUDE, OP_CUT, OP_ADD = range(3)
+_OP_NAMES = ('extrude', 'cut', 'add')
+_OP_CODES = {name: code for code, name in enumerate(_OP_NAMES)}
+
+
+class FeatureTable:
+    """Recognized features as parallel NumPy arrays (row 0 is the base feature)"""
+    def __init__(self, profiles: List[Profile], profile_ids: np.ndarray,
+                 ops: np.ndarray, depths: np.ndarray):
+        self.profiles = profiles  # Profile list that profile_ids index into
+        self.profile_ids = np.asarray(profile_ids, dtype=np.int32)
+        self.ops = np.asarray(ops, dtype=np.int8)  # OP_* codes
+        self.depths = np.asarray(depths, dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return len(self.ops)
+    
+    def __getitem__(self, i: int) -> FeatureInfo:
+        """FeatureInfo view of row i, built on demand"""
+        op = int(self.ops[i])
+        if i == 0:
+            feature_type = 'base'
+        else:
+            feature_type = 'hole' if op == OP_CUT else 'boss'
+        return FeatureInfo(self.profiles[self.profile_ids[i]], feature_type,
+                           operation=_OP_NAMES[op], depth=float(self.depths[i]))
+
+
 class DXFTo3DConverter:
     """Main converter class implementing the workflow"""
     
+    # Entity types collected by load_dxf()
+    _ENTITY_TYPES = ('LINE', 'ARC', 'CIRCLE', 'LWPOLYLINE', 'SPLINE', 'TEXT', 'DIMENSION')
+    
     def __init__(self, dxf_path: str):
         self.dxf_path = dxf_path
         self.doc = None
@@ -78,49 +256,87 @@ class DXFTo3DConverter:
         self.profiles = []
         self.features = []
         self.annotations = {}
+        self.entities_by_type = {}  # dxftype -> entities, filled by load_dxf() in one pass
+        self.geometry = None  # EntityArrays built by extract_geometry()
+        self.point_buffer = PointBuffer()  # Scratch points for every Profile.calculate_properties
         self.result_solid = None
         self.default_depth = 10.0  # Default extrusion depth
         
     def load_dxf(self):
         """Step 1: Load and parse DXF file using ezdxf"""
-        print("Loading DXF file...")
+        log.debug("Loading DXF file...")
         try:
-            self.doc = ezdxf.readfile(self.dxf_path)
-            self.msp = self.doc.modelspace()
-            print(f"✓ Loaded: {len(list(self.msp))} entities found")
+            # Stream the modelspace with iterdxf so only the entity types we use are
+            # kept; blocks, objects and the rest of the document are never loaded.
+            # Files iterdxf can't read (e.g. binary DXF) fall back to ezdxf.readfile.
+            try:
+                stream = iterdxf.opendxf(self.dxf_path)
+            except DXFStructureError:
+                stream = None
+            
+            if stream is not None:
+                try:
+                    count = self._bucket_entities(stream.modelspace())
+                finally:
+                    stream.close()
+            else:
+                self.doc = ezdxf.readfile(self.dxf_path)
+                self.msp = self.doc.modelspace()
+                count = self._bucket_entities(self.msp)
+            log.info("✓ Loaded: %d entities found", count)
         except Exception as e:
-            print(f"✗ Error loading DXF: {e}")
+            log.error("✗ Error loading DXF: %s", e)
             raise
     
+    def _bucket_entities(self, entities) -> int:
+        """Single modelspace pass into entities_by_type (every later step reads these buckets)"""
+        buckets = {t: [] for t in self._ENTITY_TYPES}
+        count = 0
+        for entity in entities:
+            count += 1
+            bucket = buckets.get(entity.dxftype())
+            if bucket is not None:
+                bucket.append(entity)
+        self.entities_by_type = buckets
+        return count
+    
     def extract_annotations(self):
         """Step 2: Parse dimensions and text annotations (annotation-driven)"""
-        print("\nExtracting annotations...")
+        log.debug("Extracting annotations...")
+        
+        debug = log.isEnabledFor(logging.DEBUG)
         
         # Extract TEXT entities
-        for text in self.msp.query('TEXT'):
-            content = text.dxf.text.upper()
-            position = (text.dxf.insert.x, text.dxf.insert.y)
+        for text in self.entities_by_type['TEXT']:
+
+            # One scan: first depth value, plus every operation keyword
+            depth_match = None
+            found = set()
+            for m in _RE_ANNOTATION.finditer(text.dxf.text):
+                if m.lastgroup == 'op':
+                    found.add(_OP_KEYWORDS[m.group('op').upper()])
+                elif depth_match is None:
+                    depth_match = m
             
             # Look for depth annotations like "DEPTH: 50", "D=50", "EXTRUDE 50"
-            depth_match = re.search(r'(?:DEPTH|D|EXTRUDE)[\s:=]+(\d+\.?\d*)', content)
             if depth_match:
-                depth_value = float(depth_match.group(1))
+                depth_value = float(depth_match.group('depth'))
                 self.annotations['depth'] = depth_value
-                print(f"  Found depth annotation: {depth_value}mm at {position}")
+                if debug:  # insert point is only read for the log line
+                    log.debug("  Found depth annotation: %smm at %s", depth_value,
+                              (text.dxf.insert.x, text.dxf.insert.y))
             
-            # Look for operation type: "CUT", "HOLE", "BOSS", "BASE"
-            if 'CUT' in content or 'HOLE' in content:
-                self.annotations['operation'] = 'cut'
-                print(f"  Found operation: CUT")
-            elif 'BOSS' in content or 'PROTRUSION' in content:
-                self.annotations['operation'] = 'add'
-                print(f"  Found operation: ADD")
-            elif 'BASE' in content:
+            # Look for operation type: "CUT", "HOLE", "BOSS", "BASE" (precedence wins)
+            operation = next((op for op in _OP_PRECEDENCE if op in found), None)
+            if operation == 'base':
                 self.annotations['base_feature'] = True
-                print(f"  Found base feature marker")
+                log.debug("  Found base feature marker")
+            elif operation is not None:
+                self.annotations['operation'] = operation
+                log.debug("  Found operation: %s", operation.upper())
         
         # Extract DIMENSION entities
-        for dim in self.msp.query('DIMENSION'):
+        for dim in self.entities_by_type['DIMENSION']:
             if hasattr(dim.dxf, 'text') and dim.dxf.text:
                 try:
                     value = float(dim.dxf.text)
@@ -131,23 +347,23 @@ class DXFTo3DConverter:
                 except ValueError:
                     pass
         
-        print(f"✓ Extracted {len(self.annotations)} annotation entries")
+        log.info("✓ Extracted %d annotation entries", len(self.annotations))
     
     def extract_geometry(self):
         """Step 3: Extract geometric entities from DXF"""
-        print("\nExtracting geometry...")
+        log.debug("Extracting geometry...")
         
-        lines = list(self.msp.query('LINE'))
-        arcs = list(self.msp.query('ARC'))
-        circles = list(self.msp.query('CIRCLE'))
-        polylines = list(self.msp.query('LWPOLYLINE'))
-        splines = list(self.msp.query('SPLINE'))
+        lines = self.entities_by_type['LINE']
+        arcs = self.entities_by_type['ARC']
+        circles = self.entities_by_type['CIRCLE']
+        polylines = self.entities_by_type['LWPOLYLINE']
+        splines = self.entities_by_type['SPLINE']
         
-        print(f"  Lines: {len(lines)}")
-        print(f"  Arcs: {len(arcs)}")
-        print(f"  Circles: {len(circles)}")
-        print(f"  Polylines: {len(polylines)}")
-        print(f"  Splines: {len(splines)}")
+        log.debug("  Lines: %d", len(lines))
+        log.debug("  Arcs: %d", len(arcs))
+        log.debug("  Circles: %d", len(circles))
+        log.debug("  Polylines: %d", len(polylines))
+        log.debug("  Splines: %d", len(splines))
         
         # Store all entities for profile detection
         self.all_entities = {
@@ -158,181 +374,244 @@ class DXFTo3DConverter:
             'splines': splines
         }
         
-        print("✓ Geometry extracted")
+        # Read coordinates out of ezdxf once; later steps work on these arrays
+        self.geometry = EntityArrays(lines, arcs, circles, polylines, splines)
+        
+        log.info("✓ Geometry extracted")
     
     def identify_profiles(self):
         """Step 4: Identify closed profiles (rule-based)"""
-        print("\nIdentifying closed profiles...")
+        log.debug("Identifying closed profiles...")
+        
+        debug = log.isEnabledFor(logging.DEBUG)
         
         # Simple approach: treat each closed polyline and circle as a profile
         profiles = []
+        extents = []  # Per profile: points whose min/max is its bounding box
         
         # Process circles (always closed)
-        for circle in self.all_entities['circles']:
-            profile = Profile([circle], is_outer=True)
-            profile.calculate_properties()
+        g = self.geometry
+        for i, circle in enumerate(self.all_entities['circles']):
+            profile = Profile([circle], is_outer=True, geometry=g,
+                              entity_ids=[g.offsets[KIND_CIRCLE] + i], kind=PROFILE_CIRCLE)
+            profile.calculate_properties(self.point_buffer)
             profiles.append(profile)
-            print(f"  Circle profile at ({circle.dxf.center.x:.2f}, {circle.dxf.center.y:.2f}), r={circle.dxf.radius:.2f}")
+            c, r = g.circle_centers[i], g.circle_radii[i]
+            extents.append(np.stack((c - r, c + r)))
+            if debug:
+                log.debug("  Circle profile at (%.2f, %.2f), r=%.2f", c[0], c[1], r)
         
         # Process closed polylines
-        for pline in self.all_entities['polylines']:
-            if pline.is_closed or pline.has_arc:
-                profile = Profile([pline], is_outer=True)
-                profile.calculate_properties()
+        for i, pline in enumerate(self.all_entities['polylines']):
+            if (pline.is_closed or pline.has_arc) and len(g.polyline_pts[i]):
+                profile = Profile([pline], is_outer=True, geometry=g,
+                                  entity_ids=[g.offsets[KIND_LWPOLY] + i], kind=PROFILE_LWPOLY)
+                profile.calculate_properties(self.point_buffer)
                 profiles.append(profile)
-                print(f"  Polyline profile with {len(list(pline.vertices()))} vertices")
-        
-        # Sort profiles by area (largest first = likely base feature)
-        profiles.sort(key=lambda p: p.area, reverse=True)
+                extents.append(g.polyline_pts[i])
+                if debug:
+                    log.debug("  Polyline profile with %d vertices", len(pline))
         
-        # Classify: largest = outer, others = inner (holes)
+        # All bounding boxes in one sweep over the concatenated extent points
         if profiles:
-            profiles[0].is_outer = True
-            for p in profiles[1:]:
-                p.is_outer = False  # Smaller profiles assumed to be holes
+            all_pts = np.concatenate(extents)
+            sizes = np.fromiter((len(e) for e in extents), dtype=np.int32, count=len(extents))
+            profile_offsets = np.zeros(len(extents) + 1, dtype=np.int32)
+            np.cumsum(sizes, out=profile_offsets[1:])
+            mins = np.minimum.reduceat(all_pts, profile_offsets[:-1], axis=0).tolist()
+            maxs = np.maximum.reduceat(all_pts, profile_offsets[:-1], axis=0).tolist()
+            for profile, lo, hi in zip(profiles, mins, maxs):
+                profile.bounding_box = (tuple(lo), tuple(hi))
+        
+        # Classify: profiles inside another profile are inner (holes), the rest outer
+        self.classify_containment(profiles)
+        
+        # Outer profiles first, then by area (largest first = likely base feature)
+        profiles.sort(key=lambda p: (not p.is_outer, -p.area))
         
         self.profiles = profiles
-        print(f"✓ Identified {len(profiles)} profiles")
+        log.info("✓ Identified %d profiles", len(profiles))
+    
+    def classify_containment(self, profiles: List[Profile]):
+        """Set is_outer by containment; R-tree MBR prefilter when rtree is installed, else a broadcast box test"""
+        g = self.geometry
+        
+        # Per profile: bounding box (set by identify_profiles), a probe point on it,
+        # and a containment test for points
+        boxes, probes, tests = [], [], []
+        for p in profiles:
+            (x0, y0), (x1, y1) = p.bounding_box
+            boxes.append((x0, y0, x1, y1))
+            eid = p.entity_ids[0]
+            i = g.entity_index[eid]
+            if g.entity_kind[eid] == KIND_CIRCLE:
+                (cx, cy), r = g.circle_centers[i].tolist(), float(g.circle_radii[i])
+                probes.append((cx, cy))
+                tests.append(lambda x, y, cx=cx, cy=cy, r=r: (x - cx)**2 + (y - cy)**2 < r * r)
+            else:
+                pts = g.polyline_pts[i]
+                probes.append(tuple(pts[0].tolist()))
+                tests.append(lambda x, y, pts=pts: _point_in_polygon(x, y, pts))
+        
+        if not boxes:
+            return
+        box_arr = np.array(boxes, dtype=np.float64)
+        box_area = (box_arr[:, 2] - box_arr[:, 0]) * (box_arr[:, 3] - box_arr[:, 1])
+        
+        def enclosing(rows: slice, cols: np.ndarray) -> np.ndarray:
+            """(rows, cols) mask: box cols encloses box rows and is strictly bigger"""
+            a, b = box_arr[cols], box_arr[rows, None, :]
+            return ((a[:, 0] <= b[..., 0]) & (a[:, 1] <= b[..., 1]) &
+                    (a[:, 2] >= b[..., 2]) & (a[:, 3] >= b[..., 3]) &
+                    (box_area[cols] > box_area[rows, None]))
+        
+        def classify(j: int, containers):
+            x, y = probes[j]
+            profiles[j].is_outer = not any(tests[i](x, y) for i in containers)
+        
+        if rtree_index is not None:
+            # Bulk-loaded from a generator (much faster than per-item inserts)
+            tree = rtree_index.Index((i, box, None) for i, box in enumerate(boxes))
+            for j, box in enumerate(boxes):
+                cols = np.fromiter(tree.intersection(box), dtype=np.intp)
+                classify(j, cols[enclosing(slice(j, j + 1), cols)[0]].tolist())
+        else:
+            # Enclosure prefilter broadcast over blocks of profiles; the point test
+            # only runs for the surviving pairs
+            cols = np.arange(len(boxes))
+            for lo in range(0, len(boxes), CONTAINMENT_BLOCK):
+                block = enclosing(slice(lo, lo + CONTAINMENT_BLOCK), cols)
+                for j, row in enumerate(block, lo):
+                    classify(j, np.flatnonzero(row).tolist())
     
     def detect_features(self):
         """Step 5: Detect features and determine operation sequence"""
-        print("\nDetecting features...")
+        log.debug("Detecting features...")
         
         if not self.profiles:
-            print("✗ No profiles found!")
+            log.error("✗ No profiles found!")
             return
         
         # Get depth from annotations or use default
         depth = self.annotations.get('depth', self.default_depth)
         
-        # First profile = base feature
-        base_profile = self.profiles[0]
-        base_feature = FeatureInfo(
-            profile=base_profile,
-            feature_type='base',
-            operation='extrude',
-            depth=depth
-        )
-        self.features.append(base_feature)
-        print(f"  Base feature: extrude depth={depth}mm")
-        
-        # Remaining profiles = holes/cuts (rule-based)
-        for i, profile in enumerate(self.profiles[1:], 1):
-            # Check if annotation specifies operation
-            operation = self.annotations.get('operation', 'cut')
-            
-            feature = FeatureInfo(
-                profile=profile,
-                feature_type='hole' if operation == 'cut' else 'boss',
-                operation=operation,
-                depth=depth
-            )
-            self.features.append(feature)
-            print(f"  Feature {i}: {feature.feature_type}, operation={operation}, depth={depth}mm")
-        
-        print(f"✓ Detected {len(self.features)} features")
+        # First profile = base feature (extrude), remaining profiles = holes/cuts
+        # (rule-based) unless an annotation specifies the operation
+        operation = self.annotations.get('operation', 'cut')
+        n = len(self.profiles)
+        ops = np.full(n, _OP_CODES[operation], dtype=np.int8)
+        ops[0] = OP_EXTRUDE
+        self.features = FeatureTable(self.profiles, np.arange(n, dtype=np.int32),
+                                     ops, np.full(n, depth, dtype=np.float64))
+        
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("  Base feature: extrude depth=%smm", depth)
+            for i in range(1, n):
+                feature = self.features[i]
+                log.debug("  Feature %d: %s, operation=%s, depth=%smm",
+                          i, feature.feature_type, feature.operation, feature.depth)
+        
+        log.info("✓ Detected %d features", len(self.features))
     
     def build_cadquery_model(self):
         """Steps 6-8: Convert to CadQuery and perform 3D operations"""
-        print("\nBuilding 3D model with CadQuery...")
+        log.debug("Building 3D model with CadQuery...")
         
         if not self.features:
-            print("✗ No features to build!")
+            log.error("✗ No features to build!")
             return
         
         # Start with base feature
-        base_feature = self.features[0]
-        result = self.create_sketch_from_profile(base_feature.profile)
+        t = self.features
+        base_profile = t.profiles[t.profile_ids[0]]
+        base_depth = float(t.depths[0])
+        result = self.create_sketch_from_profile(base_profile)
         
         if result is None:
-            print("✗ Failed to create base sketch")
+            log.error("✗ Failed to create base sketch")
             return
         
         # Extrude base
-        result = result.extrude(base_feature.depth)
-        print(f"  ✓ Extruded base feature: {base_feature.depth}mm")
+        result = result.extrude(base_depth)
+        log.debug("  ✓ Extruded base feature: %smm", base_depth)
         
-        # Apply additional features
-        for i, feature in enumerate(self.features[1:], 1):
-            try:
-                feature_sketch = self.create_sketch_from_profile(feature.profile)
-                
-                if feature_sketch is None:
-                    print(f"  ✗ Skipping feature {i}: failed to create sketch")
-                    continue
-                
-                # Perform boolean operation
-                if feature.operation == 'cut':
-                    # Create cutting solid
-                    cut_solid = feature_sketch.extrude(feature.depth)
-                    result = result.cut(cut_solid)
-                    print(f"  ✓ Cut feature {i}: depth={feature.depth}mm")
-                elif feature.operation == 'add':
-                    add_solid = feature_sketch.extrude(feature.depth)
-                    result = result.union(add_solid)
-                    print(f"  ✓ Added feature {i}: depth={feature.depth}mm")
+        # Apply additional features: build every tool solid first, then one boolean
+        # per operation against a compound instead of rebuilding the result per feature
+        for op in (OP_ADD, OP_CUT):
+            tools = []
+            for i in np.flatnonzero(t.ops == op).tolist():
+                depth = float(t.depths[i])
+                try:
+                    feature_sketch = self.create_sketch_from_profile(t.profiles[t.profile_ids[i]])
                     
-            except Exception as e:
-                print(f"  ✗ Error processing feature {i}: {e}")
+                    if feature_sketch is None:
+                        log.warning("  ✗ Skipping feature %d: failed to create sketch", i)
+                        continue
+                    
+                    tools.append((i, depth, feature_sketch.extrude(depth).val()))
+                except Exception as e:
+                    log.warning("  ✗ Error processing feature %d: %s", i, e)
+            
+            result = self._apply_tools(result, tools, _OP_NAMES[op])
         
         self.result_solid = result
-        print("✓ 3D model built successfully")
+        log.info("✓ 3D model built successfully")
+    
+    @staticmethod
+    def _apply_tools(result: cq.Workplane, tools: List[Tuple[int, float, cq.Shape]],
+                     operation: str) -> cq.Workplane:
+        """Cut or union all tool solids at once; per feature if the batched boolean fails"""
+        if not tools:
+            return result
+        
+        done = "  ✓ Cut feature %d: depth=%smm" if operation == 'cut' else "  ✓ Added feature %d: depth=%smm"
+        try:
+            compound = cq.Compound.makeCompound([solid for _, _, solid in tools])
+            result = result.cut(compound) if operation == 'cut' else result.union(compound)
+            for i, depth, _ in tools:
+                log.debug(done, i, depth)
+            return result
+        except Exception:
+            log.debug("  Batched %s failed, applying features one by one", operation)
+        
+        for i, depth, solid in tools:
+            try:
+                result = result.cut(solid) if operation == 'cut' else result.union(solid)
+                log.debug(done, i, depth)
+            except Exception as e:
+                log.warning("  ✗ Error processing feature %d: %s", i, e)
+        
+        return result
     
     def create_sketch_from_profile(self, profile: Profile) -> Optional[cq.Workplane]:
-        """Convert DXF profile to CadQuery sketch"""
+        """Convert DXF profile to CadQuery sketch (dispatched on profile.kind)"""
         try:
-            # Handle circles
-            if len(profile.edges) == 1 and profile.edges[0].dxftype() == 'CIRCLE':
-                circle = profile.edges[0]
-                cx, cy = circle.dxf.center.x, circle.dxf.center.y
-                r = circle.dxf.radius
-                
-                sketch = cq.Workplane("XY").center(cx, cy).circle(r)
-                return sketch
-            
-            # Handle polylines
-            elif len(profile.edges) == 1 and profile.edges[0].dxftype() == 'LWPOLYLINE':
-                pline = profile.edges[0]
-                points = [(v[0], v[1]) for v in pline.get_points()]
-                
-                if len(points) < 3:
-                    return None
-                
-                # Create polyline sketch
-                sketch = cq.Workplane("XY").polyline(points).close()
-                return sketch
-            
-            # For other cases, create simple rectangle as placeholder
-            else:
-                # Fallback: create a simple rectangle
-                sketch = cq.Workplane("XY").rect(20, 20)
-                return sketch
-                
+            return _SKETCH_BUILDERS[profile.kind](profile)
         except Exception as e:
-            print(f"    Error creating sketch: {e}")
+            log.warning("    Error creating sketch: %s", e)
             return None
     
     def export_step(self, output_path: str = 'output.step'):
         """Step 9: Export to STEP file"""
-        print(f"\nExporting to STEP: {output_path}")
+        log.debug("Exporting to STEP: %s", output_path)
         
         if self.result_solid is None:
-            print("✗ No solid to export!")
+            log.error("✗ No solid to export!")
             return False
         
         try:
             cq.exporters.export(self.result_solid, output_path)
-            print(f"✓ STEP file exported successfully: {output_path}")
+            log.info("✓ STEP file exported successfully: %s", output_path)
             return True
         except Exception as e:
-            print(f"✗ Export failed: {e}")
+            log.error("✗ Export failed: %s", e)
             return False
     
     def process(self):
         """Execute the complete workflow"""
-        print("="*60)
-        print("DXF to 3D STEP Converter - Prototype")
-        print("="*60)
+        log.info("=" * 60)
+        log.info("DXF to 3D STEP Converter - Prototype")
+        log.info("=" * 60)
         
         try:
             # Complete workflow
@@ -343,17 +622,47 @@ class DXFTo3DConverter:
             self.detect_features()
             self.build_cadquery_model()
             
-            print("\n" + "="*60)
-            print("Processing complete!")
-            print("="*60)
+            log.info("=" * 60)
+            log.info("Processing complete!")
+            log.info("=" * 60)
             
         except Exception as e:
-            print(f"\n✗ Processing failed: {e}")
+            log.error("✗ Processing failed: %s", e)
             raise
 
 
+def _circle_sketch(profile: Profile) -> Optional[cq.Workplane]:
+    """Sketch for a PROFILE_CIRCLE profile"""
+    g = profile.geometry
+    i = g.entity_index[profile.entity_ids[0]]
+    cx, cy = g.circle_centers[i].tolist()
+    r = float(g.circle_radii[i])
+    return cq.Workplane(_XY_PLANE).center(cx, cy).circle(r)
+
+
+def _polyline_sketch(profile: Profile) -> Optional[cq.Workplane]:
+    """Sketch for a PROFILE_LWPOLY profile"""
+    g = profile.geometry
+    points = g.polyline_pts[g.entity_index[profile.entity_ids[0]]].tolist()
+    if len(points) < 3:
+        return None
+    return cq.Workplane(_XY_PLANE).polyline(points).close()
+
+
+def _generic_sketch(profile: Profile) -> Optional[cq.Workplane]:
+    """Sketch for a PROFILE_MIXED profile"""
+    # Fallback: create a simple rectangle as placeholder
+    return cq.Workplane(_XY_PLANE).rect(20, 20)
+
+
+# Indexed by Profile.kind
+_SKETCH_BUILDERS = (_circle_sketch, _polyline_sketch, _generic_sketch)
+
+
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Example: Process a DXF file
     converter = DXFTo3DConverter('input_sketch.dxf')
     converter.process()
@@ -6,12 +6,15 @@
 # Usage (inside FreeCAD): FreeCADCmd dxf_to_solid.py path/to/input.dxf path/to/output.step [thickness_mm]
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 import FreeCAD
 import Part
 import Draft
 import importDXF        # FreeCAD module for DXF import (typically available in FreeCAD's python env)
 from FreeCAD import Vector
 
+PARALLEL_MIN_WIRES = 4  # below this, process start-up costs more than the extrusions
+
 def import_dxf(doc, filepath):
     # insert DXF objects into the doc
     # importDXF.insert is the common entrypoint used in scripts
@@ -21,31 +24,69 @@ def import_dxf(doc, filepath):
 def collect_closed_shapes(doc):
     closed_shapes = []
     for obj in doc.Objects:
-        try:
-            shp = obj.Shape
-        except Exception:
+        # Texts, dimensions, groups etc. have no Shape: skip without touching BRep data
+        shp = getattr(obj, 'Shape', None)
+        if shp is None or shp.isNull():
+            continue
+        # Decide on ShapeType first so single edges/vertices never get a wire exploration
+        stype = shp.ShapeType
+        if stype in ('Vertex', 'Edge'):
             continue
-        # Only consider planar wires / edges that can be made into faces
-        if shp.Edges:
-            # If a wire or compound is closed, its projected 2D wire can make a face
-            # We will attempt to convert each wire to a face when possible
-            for w in shp.Wires:
-                if w.isClosed():
-                    closed_shapes.append(w)
+        if stype == 'Wire':
+            if shp.isClosed():
+                closed_shapes.append(shp)
+            continue
+        # Faces, shells and compounds: keep only their closed wires
+        # (the projected 2D wire of each can be made into a face)
+        closed_shapes.extend(w for w in shp.Wires if w.isClosed())
     return closed_shapes
 
+def _extrude_wire_brep(job):
+    # Process-pool worker: BREP string of a closed wire -> (BREP string of the solid, error)
+    wire_brep, thickness = job
+    try:
+        shape = Part.Shape()
+        shape.importBrepFromString(wire_brep)
+        face = Part.Face(shape.Wires[0])     # make face from closed wire
+        solid = face.extrude(Vector(0,0,thickness))
+        return solid.exportBrepToString(), None
+    except Exception as e:
+        return None, str(e)  # OCCT exceptions don't always pickle
+
 def make_solids_from_wires(doc, wires, thickness):
+    # Each wire -> face -> extrude is independent OCCT work; with enough wires run it in
+    # worker processes (Part is not reliably thread-safe) and ship shapes as BREP strings.
+    # Document objects are only ever created here, on the main process.
+    if len(wires) < PARALLEL_MIN_WIRES:
+        results = []
+        for w in wires:
+            try:
+                face = Part.Face(w)                  # make face from closed wire
+                results.append((face.extrude(Vector(0,0,thickness)), None))
+            except Exception as e:
+                results.append((None, e))
+    else:
+        jobs = [(w.exportBrepToString(), thickness) for w in wires]
+        with ProcessPoolExecutor() as pool:
+            breps = list(pool.map(_extrude_wire_brep, jobs))
+        results = []
+        for brep, err in breps:
+            if brep is None:
+                results.append((None, err))
+                continue
+            solid = Part.Shape()
+            solid.importBrepFromString(brep)
+            results.append((solid, None))
+
     created = []
-    for i, w in enumerate(wires):
-        try:
-            face = Part.Face(w)                  # make face from closed wire
-            solid = face.extrude(Vector(0,0,thickness))
-            obj = doc.addObject("Part::Feature", f"Extruded_{i}")
-            obj.Label = f"Extruded_{i}"
-            obj.Shape = solid
-            created.append(obj)
-        except Exception as e:
-            print("Failed to extrude wire:", e)
+    for i, (solid, err) in enumerate(results):
+        if solid is None:
+            print("Failed to extrude wire:", err)
+            continue
+        obj = doc.addObject("Part::Feature", f"Extruded_{i}")
+        obj.Label = f"Extruded_{i}"
+        obj.Shape = solid
+        created.append(obj)
     return created
 
 def export_solids(doc, objs, outpath):
@@ -2,7 +2,39 @@
 # feature_detector.py - Feature Recognition and Annotation Parsing
 # ============================================================================
 
+import logging
 import re
+import sys
+
+log = logging.getLogger(__name__)
+
+# Annotation pattern, compiled once: a single scan per TEXT entity picks up depth,
+# angle, axis and operation keywords (IGNORECASE instead of an upper() copy;
+# ASCII: DXF annotation text is plain ASCII, so skip Unicode class tables)
+_RE_ANNOTATION = re.compile(
+    r'(?:DEPTH|D|EXTRUDE)[\s:=]+(?P<depth>\d+\.?\d*)'
+    r'|ANGLE[\s:=]+(?P<angle>\d+\.?\d*)'
+    r'|AXIS[\s:=]+\((?P<axis_x>\d+\.?\d*),\s*(?P<axis_y>\d+\.?\d*)\)'
+    r'|(?P<op>REVOLVE|LOFT|SWEEP|CUT|HOLE|BOSS|PROTRUSION|BASE)',
+    re.ASCII | re.IGNORECASE)
+
+# Operation names, interned once and shared by every FeatureInfo and annotation
+# dict, so comparisons and dict lookups on them hit the identity fast path
+_OP_EXTRUDE = sys.intern('extrude')
+_OP_REVOLVE = sys.intern('revolve')
+_OP_LOFT = sys.intern('loft')
+_OP_SWEEP = sys.intern('sweep')
+_OP_CUT = sys.intern('cut')
+_OP_ADD = sys.intern('add')
+_OP_BASE = sys.intern('base')
+
+# Operation keyword -> operation, and the order in which operations win
+_OP_KEYWORDS = {
+    'REVOLVE': _OP_REVOLVE, 'LOFT': _OP_LOFT, 'SWEEP': _OP_SWEEP,
+    'CUT': _OP_CUT, 'HOLE': _OP_CUT, 'BOSS': _OP_ADD, 'PROTRUSION': _OP_ADD,
+    'BASE': _OP_BASE,
+}
+_OP_PRECEDENCE = (_OP_REVOLVE, _OP_LOFT, _OP_SWEEP, _OP_CUT, _OP_ADD, _OP_BASE)
 
 
 class FeatureInfo:
@@ -26,65 +58,69 @@ class FeatureInfo:
 class FeatureDetector:
     """Handles annotation parsing and feature detection"""
     
-    def __init__(self, msp):
+    def __init__(self, msp, annotation_entities: Optional[dict] = None):
         self.msp = msp
+        self.annotation_entities = annotation_entities  # Pre-collected TEXT/DIMENSION lists, if any
         self.annotations = {}
     
+    def _entities(self, dxf_type: str):
+        """Pre-collected entities of one type, falling back to a modelspace query"""
+        if self.annotation_entities is not None and dxf_type in self.annotation_entities:
+            return self.annotation_entities[dxf_type]
+        return self.msp.query(dxf_type)
+    
     def extract_annotations(self) -> dict:
         """Parse TEXT and DIMENSION entities for annotations"""
-        print("\nExtracting annotations...")
+        log.debug("Extracting annotations...")
+        
+        debug = log.isEnabledFor(logging.DEBUG)
         
         # Extract TEXT entities
-        for text in self.msp.query('TEXT'):
-            content = text.dxf.text.upper()
-            position = (text.dxf.insert.x, text.dxf.insert.y)
+        for text in self._entities('TEXT'):
+            # One scan; the first depth/angle/axis value wins, as do all keywords
+            depth_match = angle_match = axis_match = None
+            found = set()
+            for m in _RE_ANNOTATION.finditer(text.dxf.text):
+                kind = m.lastgroup
+                if kind == 'op':
+                    found.add(_OP_KEYWORDS[m.group('op').upper()])
+                elif kind == 'depth':
+                    depth_match = depth_match or m
+                elif kind == 'angle':
+                    angle_match = angle_match or m
+                else:
+                    axis_match = axis_match or m
             
-            # Parse depth annotations: "DEPTH: 50", "D=50", "EXTRUDE 50"
-            depth_match = re.search(r'(?:DEPTH|D|EXTRUDE)[\s:=]+(\d+\.?\d*)', content)
+            # Depth annotations: "DEPTH: 50", "D=50", "EXTRUDE 50"
             if depth_match:
-                depth_value = float(depth_match.group(1))
+                depth_value = float(depth_match.group('depth'))
                 self.annotations['depth'] = depth_value
-                print(f"  Found depth: {depth_value}mm at {position}")
+                if debug:  # insert point is only read for the log line
+                    log.debug("  Found depth: %smm at %s", depth_value, (text.dxf.insert.x, text.dxf.insert.y))
             
-            # Parse operation type
-            if 'REVOLVE' in content:
-                self.annotations['operation'] = 'revolve'
-                print(f"  Found operation: REVOLVE")
-                
-                # Extract revolve angle
-                angle_match = re.search(r'(?:ANGLE)[\s:=]+(\d+\.?\d*)', content)
-                if angle_match:
-                    self.annotations['revolve_angle'] = float(angle_match.group(1))
-                    print(f"    Angle: {self.annotations['revolve_angle']}°")
+            # Operation type: highest-precedence keyword wins
+            operation = next((op for op in _OP_PRECEDENCE if op in found), None)
             
-            elif 'LOFT' in content:
-                self.annotations['operation'] = 'loft'
-                print(f"  Found operation: LOFT")
-            
-            elif 'SWEEP' in content:
-                self.annotations['operation'] = 'sweep'
-                print(f"  Found operation: SWEEP")
-            
-            elif 'CUT' in content or 'HOLE' in content:
-                self.annotations['operation'] = 'cut'
-                print(f"  Found operation: CUT")
-            
-            elif 'BOSS' in content or 'PROTRUSION' in content:
-                self.annotations['operation'] = 'add'
-                print(f"  Found operation: ADD")
-            
-            elif 'BASE' in content:
+            if operation is _OP_BASE:
                 self.annotations['base_feature'] = True
-                print(f"  Found: BASE feature marker")
+                log.debug("  Found: BASE feature marker")
+            
+            elif operation is not None:
+                self.annotations['operation'] = operation
+                log.debug("  Found operation: %s", operation.upper())
+                
+                # Extract revolve angle
+                if operation is _OP_REVOLVE and angle_match:
+                    self.annotations['revolve_angle'] = float(angle_match.group('angle'))
+                    log.debug("    Angle: %s°", self.annotations['revolve_angle'])
             
-            # Parse axis for revolve: "AXIS: (10, 0)"
-            axis_match = re.search(r'AXIS[\s:=]+\((\d+\.?\d*),\s*(\d+\.?\d*)\)', content)
+            # Axis for revolve: "AXIS: (10, 0)"
             if axis_match:
-                self.annotations['axis'] = (float(axis_match.group(1)), float(axis_match.group(2)))
-                print(f"  Found axis: {self.annotations['axis']}")
+                self.annotations['axis'] = (float(axis_match.group('axis_x')), float(axis_match.group('axis_y')))
+                log.debug("  Found axis: %s", self.annotations['axis'])
         
         # Extract DIMENSION entities
-        for dim in self.msp.query('DIMENSION'):
+        for dim in self._entities('DIMENSION'):
             if hasattr(dim.dxf, 'text') and dim.dxf.text:
                 try:
                     value = float(dim.dxf.text)
@@ -94,92 +130,93 @@ class FeatureDetector:
                 except ValueError:
                     pass
         
-        print(f"✓ Extracted {len(self.annotations)} annotation entries")
+        log.info("✓ Extracted %d annotation entries", len(self.annotations))
         return self.annotations
     
     def detect_features(self, profiles: List[Profile]) -> List[FeatureInfo]:
         """Detect features from profiles and annotations"""
-        print("\nDetecting features...")
+        log.debug("Detecting features...")
         
         if not profiles:
-            print("✗ No profiles found for feature detection!")
+            log.error("✗ No profiles found for feature detection!")
             return []
         
         features = []
         
         # Get parameters from annotations
-        operation = self.annotations.get('operation', 'extrude')
+        operation = self.annotations.get('operation', _OP_EXTRUDE)
         depth = self.annotations.get('depth', Config.DEFAULT_EXTRUDE_DEPTH)
         
         # Create base feature based on operation
-        if operation == 'revolve':
+        if operation == _OP_REVOLVE:
             angle = self.annotations.get('revolve_angle', Config.DEFAULT_REVOLVE_ANGLE)
             axis = self.annotations.get('axis', None)
             
             base_feature = FeatureInfo(
                 profile=profiles[0],
                 feature_type='base',
-                operation='revolve',
+                operation=_OP_REVOLVE,
                 depth=0,
                 axis=axis,
                 angle=angle
             )
             features.append(base_feature)
-            print(f"  Base feature: REVOLVE (angle={angle}°, axis={axis})")
+            log.debug("  Base feature: REVOLVE (angle=%s°, axis=%s)", angle, axis)
         
-        elif operation == 'loft':
+        elif operation == _OP_LOFT:
             if len(profiles) >= 2:
                 base_feature = FeatureInfo(
                     profile=profiles[0],
                     feature_type='base',
-                    operation='loft',
+                    operation=_OP_LOFT,
                     depth=depth
                 )
                 base_feature.loft_profiles = profiles[1:]
                 features.append(base_feature)
-                print(f"  Base feature: LOFT ({len(profiles)} profiles)")
+                log.debug("  Base feature: LOFT (%d profiles)", len(profiles))
             else:
-                print(f"  ⚠ LOFT requires multiple profiles, found only {len(profiles)}")
-                print(f"    Not falling back to extrude - please add more profiles or change operation")
+                log.warning("  ⚠ LOFT requires multiple profiles, found only %d", len(profiles))
+                log.warning("    Not falling back to extrude - please add more profiles or change operation")
                 return []
         
-        elif operation == 'sweep':
+        elif operation == _OP_SWEEP:
             if len(profiles) >= 2:
                 base_feature = FeatureInfo(
                     profile=profiles[0],
                     feature_type='base',
-                    operation='sweep',
+                    operation=_OP_SWEEP,
                     depth=0
                 )
                 base_feature.path_profile = profiles[1]
                 features.append(base_feature)
-                print(f"  Base feature: SWEEP (cross-section + path)")
+                log.debug("  Base feature: SWEEP (cross-section + path)")
             else:
-                print(f"  ⚠ SWEEP requires 2 profiles (cross-section + path), found only {len(profiles)}")
-                print(f"    Not falling back to extrude - please add path profile or change operation")
+                log.warning("  ⚠ SWEEP requires 2 profiles (cross-section + path), found only %d", len(profiles))
+                log.warning("    Not falling back to extrude - please add path profile or change operation")
                 return []
         
         else:  # Default: extrude
             base_feature = FeatureInfo(
                 profile=profiles[0],
                 feature_type='base',
-                operation='extrude',
+                operation=_OP_EXTRUDE,
                 depth=depth
             )
             features.append(base_feature)
-            print(f"  Base feature: EXTRUDE (depth={depth}mm)")
+            log.debug("  Base feature: EXTRUDE (depth=%smm)", depth)
             
-            # Additional profiles as cuts/additions
+            # Additional profiles as cuts/additions (same operation for all of them)
+            cut_op = self.annotations.get('operation', _OP_CUT)
+            feature_type = 'hole' if cut_op == _OP_CUT else 'boss'
             for i, profile in enumerate(profiles[1:], 1):
-                cut_op = self.annotations.get('operation', 'cut')
                 feature = FeatureInfo(
                     profile=profile,
-                    feature_type='hole' if cut_op == 'cut' else 'boss',
+                    feature_type=feature_type,
                     operation=cut_op,
                     depth=depth
                 )
                 features.append(feature)
-                print(f"  Feature {i}: {cut_op.upper()} (depth={depth}mm)")
+                log.debug("  Feature %d: %s (depth=%smm)", i, cut_op.upper(), depth)
         
-        print(f"✓ Detected {len(features)} features")
+        log.info("✓ Detected %d features", len(features))
         return features
@@ -3,145 +3,414 @@
 # ============================================================================
 
 import ezdxf
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.math import Vec3
 from typing import List, Tuple, Optional
+import hashlib
+import logging
 import math
+import os
+import tempfile
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+
+def _dist2(p: Tuple[float, float], q: Tuple[float, float]) -> float:
+    """Squared distance between two points (compare against tol * tol, no sqrt)"""
+    dx = p[0] - q[0]
+    dy = p[1] - q[1]
+    return dx*dx + dy*dy
 
 
 class GeometricEdge:
     """Wrapper for DXF entities as edges with endpoint extraction"""
     
-    def __init__(self, entity, edge_type: str):
+    # One instance per DXF edge: fixed slots instead of a per-instance __dict__
+    __slots__ = ('entity', 'edge_type', 'start_point', 'end_point', 'cx', 'cy', 'r',
+                 'start_angle_rad', 'end_angle_rad', 'control_points', 'points')
+    
+    def __init__(self, entity, edge_type: str, extract: bool = True):
         self.entity = entity
         self.edge_type = edge_type  # 'LINE', 'ARC', 'CIRCLE', 'SPLINE', 'POLYLINE'
         self.start_point = None
         self.end_point = None
-        self._extract_endpoints()
+        
+        # Geometry cached as plain values at parse time (no dxf attribute lookups later)
+        self.cx = None  # ARC/CIRCLE center and radius
+        self.cy = None
+        self.r = None
+        self.start_angle_rad = None  # ARC angles in radians, as stored in the DXF
+        self.end_angle_rad = None
+        self.control_points = None  # SPLINE control points as an (N, 2) float array
+        self.points = None  # POLYLINE vertices as an (N, 2) float array
+        
+        if extract:  # False: caller fills the fields from a batched extraction
+            self._extract_endpoints()
     
     def _extract_endpoints(self):
-        """Extract start and end points from DXF entity"""
-        if self.edge_type == 'LINE':
-            self.start_point = (self.entity.dxf.start.x, self.entity.dxf.start.y)
-            self.end_point = (self.entity.dxf.end.x, self.entity.dxf.end.y)
-        
-        elif self.edge_type == 'ARC':
-            cx, cy = self.entity.dxf.center.x, self.entity.dxf.center.y
-            r = self.entity.dxf.radius
-            start_angle = math.radians(self.entity.dxf.start_angle)
-            end_angle = math.radians(self.entity.dxf.end_angle)
-            
-            self.start_point = (
-                cx + r * math.cos(start_angle),
-                cy + r * math.sin(start_angle)
-            )
-            self.end_point = (
-                cx + r * math.cos(end_angle),
-                cy + r * math.sin(end_angle)
-            )
+        """Extract start and end points (and cached geometry) from DXF entity"""
+        extractor = self._EXTRACTORS.get(self.edge_type)
+        if extractor is not None:
+            extractor(self)
+    
+    def _extract_line(self):
+        start, end = self.entity.dxf.start, self.entity.dxf.end
+        self.start_point = (start.x, start.y)
+        self.end_point = (end.x, end.y)
+    
+    def _extract_arc(self):
+        dxf = self.entity.dxf
+        center = dxf.center
+        cx, cy = self.cx, self.cy = center.x, center.y
+        r = self.r = dxf.radius
+        start_angle = self.start_angle_rad = math.radians(dxf.start_angle)
+        end_angle = self.end_angle_rad = math.radians(dxf.end_angle)
         
-        elif self.edge_type == 'SPLINE':
-            # Assumption: Using control points for endpoints (may not be exact for complex splines)
-            if hasattr(self.entity, 'control_points') and len(self.entity.control_points) > 0:
-                self.start_point = (
-                    self.entity.control_points[0][0],
-                    self.entity.control_points[0][1]
-                )
-                self.end_point = (
-                    self.entity.control_points[-1][0],
-                    self.entity.control_points[-1][1]
-                )
-        
-        elif self.edge_type == 'CIRCLE':
-            # Circles don't have traditional start/end points
-            cx, cy = self.entity.dxf.center.x, self.entity.dxf.center.y
-            self.start_point = (cx, cy)
-            self.end_point = (cx, cy)
-        
-        elif self.edge_type == 'POLYLINE':
-            # For polylines, get first and last vertex
-            points = list(self.entity.get_points())
-            if points:
-                self.start_point = (points[0][0], points[0][1])
-                self.end_point = (points[-1][0], points[-1][1])
-    
-    def distance_to_point(self, point: Tuple[float, float]) -> float:
-        """Calculate minimum distance from this edge to a point"""
+        self.start_point = (
+            cx + r * math.cos(start_angle),
+            cy + r * math.sin(start_angle)
+        )
+        self.end_point = (
+            cx + r * math.cos(end_angle),
+            cy + r * math.sin(end_angle)
+        )
+    
+    def _extract_spline(self):
+        # Assumption: Using control points for endpoints (may not be exact for complex splines)
+        if hasattr(self.entity, 'control_points') and len(self.entity.control_points) > 0:
+            self.control_points = np.ascontiguousarray(
+                np.asarray(self.entity.control_points, dtype=np.float64)[:, :2]
+            )
+            self.start_point = tuple(self.control_points[0].tolist())
+            self.end_point = tuple(self.control_points[-1].tolist())
+    
+    def _extract_circle(self):
+        # Circles don't have traditional start/end points
+        center = self.entity.dxf.center
+        cx, cy = self.cx, self.cy = center.x, center.y
+        self.r = self.entity.dxf.radius
+        self.start_point = (cx, cy)
+        self.end_point = (cx, cy)
+    
+    def _extract_polyline(self):
+        # For polylines, get first and last vertex
+        points = self.entity.get_points('xy')
+        if points:
+            self.points = np.array(points, dtype=np.float64).reshape(-1, 2)
+            self.start_point = tuple(points[0])
+            self.end_point = tuple(points[-1])
+    
+    # edge_type -> extractor, one dict lookup instead of an if/elif cascade
+    _EXTRACTORS = {
+        'LINE': _extract_line,
+        'ARC': _extract_arc,
+        'SPLINE': _extract_spline,
+        'CIRCLE': _extract_circle,
+        'POLYLINE': _extract_polyline,
+    }
+    
+    def sqdist_to_point(self, point: Tuple[float, float]) -> float:
+        """Squared minimum distance from this edge's endpoints to a point"""
         if self.start_point is None:
             return float('inf')
         
-        dx1 = point[0] - self.start_point[0]
-        dy1 = point[1] - self.start_point[1]
-        dist_start = math.sqrt(dx1*dx1 + dy1*dy1)
+        dist_start = _dist2(point, self.start_point)
         
         if self.end_point:
-            dx2 = point[0] - self.end_point[0]
-            dy2 = point[1] - self.end_point[1]
-            dist_end = math.sqrt(dx2*dx2 + dy2*dy2)
-            return min(dist_start, dist_end)
+            return min(dist_start, _dist2(point, self.end_point))
         
         return dist_start
 
 
+def _arc_edges(arcs: list) -> List[GeometricEdge]:
+    """ARC edges with endpoints from one vectorized trig pass over all arcs"""
+    if not arcs:
+        return []
+    
+    geom = np.array([(a.dxf.center.x, a.dxf.center.y, a.dxf.radius, a.dxf.start_angle, a.dxf.end_angle)
+                     for a in arcs], dtype=np.float64)
+    radius = geom[:, 2:3]
+    angles = np.radians(geom[:, 3:5])  # (N, 2): start, end
+    xs = geom[:, 0:1] + radius * np.cos(angles)
+    ys = geom[:, 1:2] + radius * np.sin(angles)
+    
+    edges = []
+    for entity, (cx, cy, r), (a0, a1), (sx, ex), (sy, ey) in zip(
+            arcs, geom[:, :3].tolist(), angles.tolist(), xs.tolist(), ys.tolist()):
+        edge = GeometricEdge(entity, 'ARC', extract=False)
+        edge.cx, edge.cy, edge.r = cx, cy, r
+        edge.start_angle_rad, edge.end_angle_rad = a0, a1
+        edge.start_point = (sx, sy)
+        edge.end_point = (ex, ey)
+        edges.append(edge)
+    return edges
+
+
+# GeometricEdge.edge_type -> EdgeArray.types code
+EDGE_TYPE_CODES = {'LINE': 0, 'ARC': 1, 'CIRCLE': 2, 'SPLINE': 3, 'POLYLINE': 4}
+_EDGE_TYPE_NAMES = {code: name for name, code in EDGE_TYPE_CODES.items()}
+
+# Bump when the cached arrays change meaning, so stale cache files are never read
+GEOMETRY_CACHE_VERSION = 1
+
+
+class EdgeArray:
+    """
+    Edge endpoints as parallel NumPy arrays (row i describes edges[i])
+    endpoints is one contiguous (2N, 2) float64 matrix: start points in rows 0..N-1,
+    end points in rows N..2N-1; starts/ends are views of its two halves.
+    Missing endpoints (e.g. a spline without control points) are NaN rows.
+    """
+    
+    def __init__(self, edges: List[GeometricEdge]):
+        missing = (math.nan, math.nan)
+        n = len(edges)
+        self.endpoints = np.array([e.start_point or missing for e in edges] +
+                                  [e.end_point or missing for e in edges], dtype=np.float64).reshape(-1, 2)
+        self.starts = self.endpoints[:n]
+        self.ends = self.endpoints[n:]
+        self.types = np.fromiter((EDGE_TYPE_CODES[e.edge_type] for e in edges), dtype=np.uint8, count=n)
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def endpoint_rows(self, ids: np.ndarray) -> np.ndarray:
+        """(2R, 2) endpoints of edges ids in the same layout: their starts, then their ends"""
+        return self.endpoints[np.concatenate((ids, ids + len(self)))]
+    
+    def sqdist_to_point(self, point: Tuple[float, float]) -> np.ndarray:
+        """Squared minimum endpoint distance of every edge to a point (inf without endpoints)"""
+        d = self.endpoints - np.asarray(point, dtype=np.float64)
+        d_start, d_end = np.einsum('ij,ij->i', d, d).reshape(2, -1)
+        return np.nan_to_num(np.fmin(d_start, d_end), nan=np.inf)
+
+
 class GeometryParser:
     """Handles DXF file loading and geometric entity extraction"""
     
+    # DXF type -> GeometricEdge type, in the order edges are emitted
+    _EDGE_TYPES = {
+        'LINE': 'LINE',
+        'ARC': 'ARC',
+        'CIRCLE': 'CIRCLE',
+        'SPLINE': 'SPLINE',
+        'LWPOLYLINE': 'POLYLINE',
+    }
+    _ANNOTATION_TYPES = ('TEXT', 'DIMENSION')
+    
     def __init__(self, dxf_path: str):
         self.dxf_path = dxf_path
-        self.doc = None
+        self.doc = None  # Only set when the DXF had to be read with ezdxf.readfile (e.g. binary DXF)
         self.msp = None
+        self.entity_count = 0  # Modelspace entities seen by load_dxf()
         self.geometric_edges = []
+        self.edge_array = None  # EdgeArray over geometric_edges, built by extract_geometry()
+        self.annotation_entities = {}  # 'TEXT'/'DIMENSION' -> entities, collected by load_dxf()
+        self.cache_path = None  # Geometry cache file for this DXF (Config.ENABLE_GEOMETRY_CACHE)
+        self.from_cache = False  # True when load_dxf() restored the edges from the cache
+        self._buckets = None  # DXF type -> entities, from load_dxf() until extract_geometry()
     
     def load_dxf(self) -> bool:
         """Load DXF file"""
-        print("Loading DXF file...")
+        log.debug("Loading DXF file...")
         try:
-            self.doc = ezdxf.readfile(self.dxf_path)
-            self.msp = self.doc.modelspace()
-            entity_count = len(list(self.msp))
-            print(f"✓ Loaded: {entity_count} entities found")
+            if Config.ENABLE_GEOMETRY_CACHE:
+                self.cache_path = self._geometry_cache_path()
+                if self._load_geometry_cache():
+                    return True
+            
+            # Stream the modelspace with iterdxf so only the entity types we use are
+            # kept; blocks, objects and the rest of the document are never loaded.
+            stream = self._open_stream()
+            if stream is not None:
+                try:
+                    self._bucket_entities(stream.modelspace())
+                finally:
+                    stream.close()
+            else:
+                self._bucket_entities(self.msp)
+            log.info("✓ Loaded: %d entities found", self.entity_count)
             return True
         except FileNotFoundError:
-            print(f"✗ Error: DXF file not found: {self.dxf_path}")
+            log.error("✗ Error: DXF file not found: %s", self.dxf_path)
             return False
         except Exception as e:
-            print(f"✗ Error loading DXF: {e}")
+            log.error("✗ Error loading DXF: %s", e)
             return False
     
+    def _open_stream(self):
+        """iterdxf stream of the DXF, or None after falling back to ezdxf.readfile (sets doc/msp)"""
+        try:
+            return iterdxf.opendxf(self.dxf_path)
+        except DXFStructureError:  # iterdxf can't read e.g. binary DXF
+            self.doc = ezdxf.readfile(self.dxf_path)
+            self.msp = self.doc.modelspace()
+            return None
+    
+    def _bucket_entities(self, entities):
+        """
+        Single modelspace pass: bucket geometry by type (keeps the per-type edge order)
+        and collect annotation entities for FeatureDetector on the way
+        """
+        buckets = {dxf_type: [] for dxf_type in self._EDGE_TYPES}
+        buckets.update((dxf_type, []) for dxf_type in self._ANNOTATION_TYPES)
+        count = 0
+        for entity in entities:
+            count += 1
+            bucket = buckets.get(entity.dxftype())
+            if bucket is not None:
+                bucket.append(entity)
+        
+        self.entity_count = count
+        self.annotation_entities = {dxf_type: buckets[dxf_type] for dxf_type in self._ANNOTATION_TYPES}
+        self._buckets = buckets
+    
     def extract_geometry(self) -> List[GeometricEdge]:
         """Extract all geometric entities from DXF"""
-        print("\nExtracting geometry...")
-        
-        # Query different entity types
-        lines = list(self.msp.query('LINE'))
-        arcs = list(self.msp.query('ARC'))
-        circles = list(self.msp.query('CIRCLE'))
-        polylines = list(self.msp.query('LWPOLYLINE'))
-        splines = list(self.msp.query('SPLINE'))
-        
-        print(f"  Lines: {len(lines)}")
-        print(f"  Arcs: {len(arcs)}")
-        print(f"  Circles: {len(circles)}")
-        print(f"  Polylines: {len(polylines)}")
-        print(f"  Splines: {len(splines)}")
-        
-        # Convert to GeometricEdge objects
+        if self.from_cache:  # Edges were restored by load_dxf()
+            return self.geometric_edges
+        
+        log.debug("Extracting geometry...")
+        
+        edge_types = self._EDGE_TYPES
+        buckets = self._buckets
+        self._buckets = None  # Edges keep their entities; the buckets aren't needed past this point
+        
+        log.debug("  Lines: %d", len(buckets['LINE']))
+        log.debug("  Arcs: %d", len(buckets['ARC']))
+        log.debug("  Circles: %d", len(buckets['CIRCLE']))
+        log.debug("  Polylines: %d", len(buckets['LWPOLYLINE']))
+        log.debug("  Splines: %d", len(buckets['SPLINE']))
+        
         edges = []
+        for dxf_type, edge_type in edge_types.items():
+            if edge_type == 'ARC':
+                edges.extend(_arc_edges(buckets[dxf_type]))  # Batched trig for all arcs
+            else:
+                edges.extend(GeometricEdge(entity, edge_type) for entity in buckets[dxf_type])
         
-        for line in lines:
-            edges.append(GeometricEdge(line, 'LINE'))
+        self.geometric_edges = edges
+        self.edge_array = EdgeArray(edges)
+        log.info("✓ Created %d geometric edges", len(edges))
         
-        for arc in arcs:
-            edges.append(GeometricEdge(arc, 'ARC'))
+        if self.cache_path is not None:
+            self._save_geometry_cache()
+        return edges
+    
+    def _geometry_cache_path(self) -> str:
+        """
+        Cache file keyed by (absolute path, mtime, size) of the DXF, named
+        <path digest>-<version digest>.npz so older entries of the same DXF can be pruned
+        """
+        path = os.path.abspath(self.dxf_path)
+        st = os.stat(path)  # FileNotFoundError is reported by load_dxf()
+        path_digest = hashlib.sha1(path.encode('utf-8')).hexdigest()
+        key = f"{GEOMETRY_CACHE_VERSION}|{st.st_mtime_ns}|{st.st_size}"
+        version_digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(os.path.expanduser(Config.GEOMETRY_CACHE_DIR),
+                            f"{path_digest}-{version_digest}.npz")
+    
+    def _prune_geometry_cache(self):
+        """Remove cache files of earlier versions of this DXF (keeps one entry per path)"""
+        cache_dir, name = os.path.split(self.cache_path)
+        prefix = name.split('-', 1)[0] + '-'
+        try:
+            stale = [f for f in os.listdir(cache_dir)
+                     if f.startswith(prefix) and f.endswith('.npz') and f != name]
+            for f in stale:
+                os.remove(os.path.join(cache_dir, f))
+        except OSError as e:
+            log.warning("⚠ Could not prune geometry cache: %s", e)
+    
+    def _save_geometry_cache(self):
+        """Write the edge arrays to cache_path (atomic replace, failures only logged)"""
+        edges = self.geometric_edges
+        nan5 = (math.nan,) * 5
+        circles = np.array([(e.cx, e.cy, e.r,
+                             math.nan if e.start_angle_rad is None else e.start_angle_rad,
+                             math.nan if e.end_angle_rad is None else e.end_angle_rad)
+                            if e.r is not None else nan5 for e in edges], dtype=np.float64).reshape(-1, 5)
         
-        for circle in circles:
-            edges.append(GeometricEdge(circle, 'CIRCLE'))
+        # Ragged SPLINE control points / POLYLINE vertices: one (M, 2) array plus offsets
+        point_sets = [e.control_points if e.control_points is not None else e.points for e in edges]
+        counts = [0 if pts is None else len(pts) for pts in point_sets]
+        offsets = np.zeros(len(edges) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        points = [pts for pts in point_sets if pts is not None and len(pts)]
+        points = np.concatenate(points) if points else np.empty((0, 2), dtype=np.float64)
         
-        for spline in splines:
-            edges.append(GeometricEdge(spline, 'SPLINE'))
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(self.cache_path), suffix='.tmp',
+                                             delete=False) as f:
+                tmp_path = f.name
+                np.savez(f, types=self.edge_array.types, starts=self.edge_array.starts,
+                         ends=self.edge_array.ends, circles=circles, offsets=offsets, points=points,
+                         entity_count=np.int64(self.entity_count))
+            os.replace(tmp_path, self.cache_path)
+            log.debug("  Geometry cached: %s", self.cache_path)
+            self._prune_geometry_cache()
+        except OSError as e:
+            log.warning("⚠ Could not write geometry cache: %s", e)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _load_geometry_cache(self) -> bool:
+        """Restore edges from cache_path; only annotation entities are read from the DXF"""
+        if not os.path.exists(self.cache_path):
+            return False
+        try:
+            with np.load(self.cache_path) as data:
+                types = data['types']
+                starts, ends = data['starts'], data['ends']
+                circles, offsets, points = data['circles'], data['offsets'], data['points']
+                self.entity_count = int(data['entity_count'])
+        except (OSError, ValueError, KeyError) as e:
+            log.warning("⚠ Ignoring unreadable geometry cache: %s", e)
+            return False
         
-        for pline in polylines:
-            edges.append(GeometricEdge(pline, 'POLYLINE'))
+        edges = []
+        for i, (code, start, end, (cx, cy, r, a0, a1)) in enumerate(zip(
+                types.tolist(), starts.tolist(), ends.tolist(), circles.tolist())):
+            edge = GeometricEdge(None, _EDGE_TYPE_NAMES[code], extract=False)
+            if start[0] == start[0]:  # NaN row: no endpoints
+                edge.start_point = tuple(start)
+                edge.end_point = tuple(end)
+            if r == r:
+                edge.cx, edge.cy, edge.r = cx, cy, r
+                if a0 == a0:
+                    edge.start_angle_rad, edge.end_angle_rad = a0, a1
+            lo, hi = offsets[i], offsets[i + 1]
+            if hi > lo:
+                if edge.edge_type == 'SPLINE':
+                    edge.control_points = points[lo:hi]
+                else:
+                    edge.points = points[lo:hi]
+            edges.append(edge)
         
+        self.annotation_entities = self._read_annotations()
         self.geometric_edges = edges
-        print(f"✓ Created {len(edges)} geometric edges")
-        return edges
\ No newline at end of file
+        self.edge_array = EdgeArray(edges)
+        self.from_cache = True
+        log.info("✓ Loaded: %d entities found (geometry cache)", self.entity_count)
+        log.info("✓ Created %d geometric edges", len(edges))
+        return True
+    
+    def _read_annotations(self) -> dict:
+        """TEXT/DIMENSION entities only, streamed with iterdxf (ezdxf.readfile for e.g. binary DXF)"""
+        annotations = {dxf_type: [] for dxf_type in self._ANNOTATION_TYPES}
+        stream = self._open_stream()
+        if stream is not None:
+            try:
+                entities = list(stream.modelspace(types=self._ANNOTATION_TYPES))
+            finally:
+                stream.close()
+        else:
+            entities = self.msp.query(' '.join(self._ANNOTATION_TYPES))
+        
+        for entity in entities:
+            annotations[entity.dxftype()].append(entity)
+        return annotations
\ No newline at end of file
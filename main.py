@@ -2,6 +2,15 @@
 # main.py - Main Converter Orchestration
 # ============================================================================
 
+import argparse
+import logging
+
+log = logging.getLogger(__name__)
+
+# Loggers of the pipeline modules (each logs under its module name)
+_PIPELINE_LOGGERS = ('geometry_parser', 'profile_detector', 'feature_detector', 'cad_builder', __name__)
+
+
 class DXFTo3DConverter:
     """Main orchestrator for DXF to 3D STEP conversion"""
     
@@ -15,9 +24,9 @@ class DXFTo3DConverter:
     
     def process(self) -> bool:
         """Execute complete conversion workflow"""
-        print("="*60)
-        print("DXF to 3D STEP Converter - Modular Architecture")
-        print("="*60)
+        log.info("=" * 60)
+        log.info("DXF to 3D STEP Converter - Modular Architecture")
+        log.info("=" * 60)
         
         try:
             # Step 1: Parse DXF geometry
@@ -32,13 +41,13 @@ class DXFTo3DConverter:
                 return False
             
             # Step 2: Detect profiles
-            self.profiles = ProfileDetector.chain_edges_into_profiles(geometric_edges)
+            self.profiles = ProfileDetector.chain_edges_into_profiles(geometric_edges, self.parser.edge_array)
             if not self.profiles:
                 self.error_log.append("No valid profiles detected")
                 return False
             
             # Step 3: Extract annotations and detect features
-            feature_detector = FeatureDetector(self.parser.msp)
+            feature_detector = FeatureDetector(self.parser.msp, self.parser.annotation_entities)
             annotations = feature_detector.extract_annotations()
             self.features = feature_detector.detect_features(self.profiles)
             
@@ -53,34 +62,32 @@ class DXFTo3DConverter:
                 self.error_log.append(f"3D model building failed: {error_msg}")
                 return False
             
-            print("\n" + "="*60)
-            print("Processing complete!")
-            print("="*60)
+            log.info("=" * 60)
+            log.info("Processing complete!")
+            log.info("=" * 60)
             return True
         
         except Exception as e:
             error = f"Unexpected error during processing: {str(e)}"
-            print(f"\n✗ {error}")
+            log.error("✗ %s", error, exc_info=True)
             self.error_log.append(error)
-            import traceback
-            traceback.print_exc()
             return False
     
     def export_step(self, output_path: str = 'output.step') -> bool:
         """Export result to STEP file"""
-        print(f"\nExporting to STEP: {output_path}")
+        log.debug("Exporting to STEP: %s", output_path)
         
         if self.result_solid is None:
-            print("✗ No solid to export! Run process() first.")
+            log.error("✗ No solid to export! Run process() first.")
             return False
         
         try:
             cq.exporters.export(self.result_solid, output_path)
-            print(f"✓ STEP file exported successfully: {output_path}")
+            log.info("✓ STEP file exported successfully: %s", output_path)
             return True
         except Exception as e:
             error = f"Export failed: {str(e)}"
-            print(f"✗ {error}")
+            log.error("✗ %s", error)
             self.error_log.append(error)
             return False
     
@@ -120,6 +127,21 @@ class DXFTo3DConverter:
 # ============================================================================
 
 if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="DXF to 3D STEP converter")
+    arg_parser.add_argument('-v', '--verbose', action='store_true',
+                            help="per-entity/per-feature detail (default: step totals only)")
+    args = arg_parser.parse_args()
+    
+    # Library modules log instead of printing; show the pipeline's progress on the console.
+    # Only the pipeline loggers are configured, so the root logger and third-party
+    # libraries (e.g. ezdxf) keep their own levels
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    for name in _PIPELINE_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+        logger.addHandler(console)
+    
     # Basic usage
     converter = DXFTo3DConverter('input_sketch.dxf')
     
@@ -2,57 +2,234 @@
 # profile_detector.py - Profile Chaining and Classification
 # ============================================================================
 
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+try:
+    from numba import njit  # Optional: compiled edge-chaining kernel
+except ImportError:
+    njit = None
+
+
+def _chain_kernel(endpoints, pts, owner, at_end, keys, ox, oy, width, tol, tol2):
+    """
+    Walk edge chains over endpoint rows sorted by grid cell key
+    endpoints: (M, 2, 2) start/end per local edge id (NaN = missing); pts/owner/at_end:
+    endpoint rows sorted by keys. Lowest edge id wins (start before end), and a chain
+    stops when it returns to its start. Returns (edge ids, reversed flags, chain offsets).
+    """
+    m = endpoints.shape[0]
+    used = np.zeros(m, dtype=np.bool_)
+    out_ids = np.empty(m, dtype=np.int64)
+    out_rev = np.zeros(m, dtype=np.bool_)
+    offsets = np.zeros(m + 1, dtype=np.int64)
+    n_out = 0
+    n_chains = 0
+    
+    for s in range(m):
+        if used[s]:
+            continue
+        used[s] = True
+        out_ids[n_out] = s
+        out_rev[n_out] = False
+        n_out += 1
+        
+        x, y = endpoints[s, 1, 0], endpoints[s, 1, 1]
+        sx, sy = endpoints[s, 0, 0], endpoints[s, 0, 1]
+        has_start = not np.isnan(sx)
+        while not np.isnan(x):
+            cx = int(np.floor(x / tol)) - ox
+            cy = int(np.floor(y / tol)) - oy
+            best = -1
+            best_rev = True
+            for i in range(-1, 2):
+                for j in range(-1, 2):
+                    key = (cx + i) * width + (cy + j)
+                    k = np.searchsorted(keys, key)
+                    while k < keys.shape[0] and keys[k] == key:
+                        e = owner[k]
+                        if not used[e]:
+                            dx = pts[k, 0] - x
+                            dy = pts[k, 1] - y
+                            if dx*dx + dy*dy < tol2:
+                                rev = at_end[k]
+                                if best < 0 or e < best or (e == best and best_rev and not rev):
+                                    best = e
+                                    best_rev = rev
+                        k += 1
+            
+            if best < 0:
+                break
+            
+            used[best] = True
+            out_ids[n_out] = best
+            out_rev[n_out] = best_rev
+            n_out += 1
+            # Far endpoint by index: the start when walked reversed, else the end
+            side = 1 - best_rev
+            x, y = endpoints[best, side, 0], endpoints[best, side, 1]
+            
+            if has_start:
+                dx = x - sx
+                dy = y - sy
+                if dx*dx + dy*dy < tol2:
+                    break
+        
+        n_chains += 1
+        offsets[n_chains] = n_out
+    
+    return out_ids[:n_out], out_rev[:n_out], offsets[:n_chains + 1]
+
+
+if njit is not None:
+    _chain_kernel = njit(cache=True)(_chain_kernel)
+
+log = logging.getLogger(__name__)
+
+
+def arc_circle(edges: List[GeometricEdge]) -> Optional[Tuple[float, float, float]]:
+    """Return (cx, cy, r) if edges are arcs of one circle jointly sweeping 360°, else None"""
+    tol = Config.POINT_COINCIDENCE_TOLERANCE
+    if not edges or edges[0].edge_type != 'ARC':
+        return None
+    cx, cy, r = edges[0].cx, edges[0].cy, edges[0].r
+    
+    sweep = 0.0
+    for edge in edges:
+        if edge.edge_type != 'ARC':
+            return None
+        if abs(edge.cx - cx) > tol or abs(edge.cy - cy) > tol or abs(edge.r - r) > tol:
+            return None
+        sweep += (edge.end_angle_rad - edge.start_angle_rad) % (2 * math.pi)
+    
+    if r <= 0 or abs(sweep - 2 * math.pi) > tol / r:
+        return None
+    return cx, cy, r
+
+
+def _chain_points(first: np.ndarray, second: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Point sequence of chained edges from their (N, 2) oriented start/end rows (NaN = missing):
+    each edge's start, then its end unless missing or equal to the start.
+    Returns the interleaved (2N, 2) rows and the mask of rows that belong to the sequence.
+    """
+    points = np.stack((first, second), axis=1).reshape(-1, 2)
+    keep = ~np.isnan(points[:, 0])
+    keep[1::2] &= ~(second == first).all(axis=1)
+    return points, keep
+
+
+def _shoelace_properties(points: np.ndarray, counts: np.ndarray):
+    """
+    Area, centroid, bounding box and squared closure gap of profiles whose point
+    sequences are stored back to back in points (counts[k] points for profile k)
+    Returns (areas, cx, cy, lows, highs, gaps_sq), one row per profile.
+    """
+    offsets = np.zeros(len(counts), dtype=np.intp)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    owner = np.repeat(np.arange(len(counts)), counts)
+    
+    # Shoelace with each profile's last point wrapping to its first
+    nxt = np.arange(1, len(points) + 1)
+    nxt[offsets + counts - 1] = offsets
+    x, y = points[:, 0], points[:, 1]
+    areas = 0.5 * np.abs(np.bincount(owner, x * y[nxt] - y * x[nxt], minlength=len(counts)))
+    cx = np.bincount(owner, x, minlength=len(counts)) / counts
+    cy = np.bincount(owner, y, minlength=len(counts)) / counts
+    lows = np.minimum.reduceat(points, offsets)
+    highs = np.maximum.reduceat(points, offsets)
+    gaps = points[offsets + counts - 1] - points[offsets]
+    gaps_sq = np.einsum('ij,ij->i', gaps, gaps)
+    return areas, cx, cy, lows, highs, gaps_sq
+
 class Profile:
     """Represents a closed 2D profile (contour)"""
     
-    def __init__(self, edges: List[GeometricEdge], is_outer: bool = True):
+    __slots__ = ('edges', 'is_outer', 'primary_kind', 'reversed_edges', 'area', 'centroid',
+                 'bounding_box', 'is_closed', 'closure_gap', '_closure_cache', '_props_computed',
+                 'line_order', 'line_endpoints')
+    
+    def __init__(self, edges: List[GeometricEdge], is_outer: bool = True,
+                 reversed_edges: Optional[List[bool]] = None, primary_kind: Optional[str] = None):
         self.edges = edges
         self.is_outer = is_outer
+        if primary_kind is None:
+            single = len(edges) == 1 and edges[0].edge_type in ('CIRCLE', 'POLYLINE')
+            primary_kind = edges[0].edge_type if single else 'MIXED'
+        self.primary_kind = primary_kind  # 'CIRCLE', 'POLYLINE' or 'MIXED' (chained edges)
+        self.reversed_edges = reversed_edges or [False] * len(edges)  # Edge walked end -> start
         self.area = 0.0
         self.centroid = (0.0, 0.0)
         self.bounding_box = None
         self.is_closed = False
         self.closure_gap = 0.0  # Distance between first and last point
+        self._closure_cache: Optional[Tuple[bool, str]] = None  # Memoized validate_closure() verdict
+        self._props_computed = False  # calculate_properties() ran since the last invalidate()
+        
+        self._index_lines()
+    
+    def _index_lines(self):
+        """LINE edges as flat [sx, sy, ex, ey] rows in chain order and direction, plus their edge indices"""
+        self.line_order = np.array(
+            [i for i, edge in enumerate(self.edges) if edge.edge_type == 'LINE'], dtype=np.intp
+        )
+        oriented = [self.oriented_endpoints(i) for i in self.line_order]
+        self.line_endpoints = np.array([s + e for s, e in oriented], dtype=np.float64).reshape(-1, 4)
+    
+    def oriented_endpoints(self, i: int) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+        """(start, end) of edge i in the direction the chain walks it"""
+        edge = self.edges[i]
+        if self.reversed_edges[i]:
+            return edge.end_point, edge.start_point
+        return edge.start_point, edge.end_point
     
     def calculate_properties(self):
-        """Calculate area, centroid, and closure status"""
+        """Calculate area, centroid, and closure status (once, until invalidate())"""
+        if self._props_computed:
+            return
+        self._props_computed = True
+        self._closure_cache = None
         if not self.edges:
             return
         
-        points = []
-        for edge in self.edges:
-            if edge.start_point:
-                points.append(edge.start_point)
-            if edge.end_point and edge.end_point != edge.start_point:
-                points.append(edge.end_point)
+        missing = (math.nan, math.nan)
+        oriented = [self.oriented_endpoints(i) for i in range(len(self.edges))]
+        first = np.array([start or missing for start, _ in oriented], dtype=np.float64)
+        second = np.array([end or missing for _, end in oriented], dtype=np.float64)
+        points, keep = _chain_points(first, second)
+        points = points[keep]
         
         if len(points) >= Config.MIN_PROFILE_EDGES:
-            # Calculate area using shoelace formula
-            area = 0.0
-            for i in range(len(points)):
-                j = (i + 1) % len(points)
-                area += points[i][0] * points[j][1]
-                area -= points[j][0] * points[i][1]
-            self.area = abs(area) / 2.0
-            
-            # Calculate centroid
-            cx = sum(p[0] for p in points) / len(points)
-            cy = sum(p[1] for p in points) / len(points)
-            self.centroid = (cx, cy)
-            
-            # Check closure
-            if len(points) > 0:
-                first = points[0]
-                last = points[-1]
-                self.closure_gap = math.sqrt((last[0]-first[0])**2 + (last[1]-first[1])**2)
-                self.is_closed = self.closure_gap < Config.PROFILE_CLOSURE_TOLERANCE
+            self._set_properties(*(v[0] for v in _shoelace_properties(points, np.array([len(points)]))))
+    
+    def _set_properties(self, area, cx, cy, low, high, gap_sq):
+        """Store one profile's row of _shoelace_properties()"""
+        self.area = float(area)
+        self.centroid = (float(cx), float(cy))
+        self.bounding_box = (tuple(low.tolist()), tuple(high.tolist()))
+        self.closure_gap = math.sqrt(gap_sq)
+        self.is_closed = bool(gap_sq < Config.PROFILE_CLOSURE_TOLERANCE_SQ)
+    
+    def invalidate(self):
+        """Drop memoized properties and closure verdict (call after mutating edges)"""
+        self._props_computed = False
+        self._closure_cache = None
+        self._index_lines()
     
     def validate_closure(self) -> Tuple[bool, str]:
-        """Validate if profile is properly closed"""
+        """Validate if profile is properly closed (cached until invalidate())"""
+        if self._closure_cache is None:
+            self._closure_cache = self._check_closure()
+        return self._closure_cache
+    
+    def _check_closure(self) -> Tuple[bool, str]:
         if not self.edges:
             return False, "Profile has no edges"
         
-        if len(self.edges) < Config.MIN_PROFILE_EDGES:
+        # Arcs of one full circle (e.g. two half-circles) need fewer than MIN_PROFILE_EDGES
+        if len(self.edges) < Config.MIN_PROFILE_EDGES and arc_circle(self.edges) is None:
             return False, f"Profile has only {len(self.edges)} edges (minimum {Config.MIN_PROFILE_EDGES} required)"
         
         # Circles and closed polylines are always valid
@@ -73,89 +250,309 @@ class ProfileDetector:
     @staticmethod
     def point_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
         """Calculate distance between two points"""
-        return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+        return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+    
+    @staticmethod
+    def _endpoint_cell(point: Tuple[float, float], tol: float) -> Tuple[int, int]:
+        """Grid cell of a point for the endpoint index (cell size = tol, same cells as _chain_kernel)"""
+        return (int(point[0] // tol), int(point[1] // tol))
     
     @staticmethod
-    def chain_edges_into_profiles(edges: List[GeometricEdge]) -> List[Profile]:
-        """Chain disconnected edges into closed profiles"""
-        print("\nChaining edges into profiles...")
+    def _endpoint_index(points: List[Tuple[float, float]], tol: float):
+        """
+        Uniform-grid spatial hash over endpoint rows, built once per chaining run
+        Returns near(point) -> candidate row indices (a superset of the rows within tol):
+        the rows in the 3x3 tol-sized cells around the point. No tree to build, and
+        the dict-of-small-lists lookups beat a KD-tree query at these cell occupancies.
+        """
+        grid = {}
+        for row, point in enumerate(points):
+            grid.setdefault(ProfileDetector._endpoint_cell(point, tol), []).append(row)
         
-        profiles = []
-        used_edges = set()
+        def near(point):
+            cx, cy = ProfileDetector._endpoint_cell(point, tol)
+            for i in (-1, 0, 1):
+                for j in (-1, 0, 1):
+                    yield from grid.get((cx + i, cy + j), ())
+        return near
+    
+    @staticmethod
+    def _chain_indexed(starts: np.ndarray, ends: np.ndarray,
+                       remaining: np.ndarray) -> List[Tuple[List[int], List[bool]]]:
+        """
+        Walk chains over the remaining edges with a grid endpoint index
+        starts/ends: (R, 2) endpoints of the remaining edges (rows of the SoA arrays)
+        Returns [(edge indices in chain order, walked-reversed flags)] per chain.
+        """
+        # (R, 2, 2) start/end of the remaining edges by local id;
+        # lookup[i][side] gives an edge's start (0) or end (1)
+        tol = Config.EDGE_CONNECTION_TOLERANCE
+        tol_sq = Config.EDGE_CONNECTION_TOLERANCE_SQ
+        endpoints = np.stack((starts, ends), axis=1)
+        lookup = endpoints.tolist()
         
-        # Step 1: Handle circles and closed polylines (already closed)
-        for i, edge in enumerate(edges):
-            if i in used_edges:
+        # Endpoint rows: point, owning edge, and whether it is that edge's end point
+        # (connecting there means walking it in reverse); edges without endpoints
+        # have no rows
+        rows = endpoints.reshape(-1, 2)
+        valid = ~np.isnan(rows[:, 0])
+        points = rows[valid].tolist()
+        owners = np.repeat(np.arange(len(remaining)), 2)[valid].tolist()
+        at_end = np.tile((False, True), len(remaining))[valid].tolist()
+        has_endpoints = valid[::2].tolist()
+        near = ProfileDetector._endpoint_index(points, tol)
+        
+        used = np.zeros(len(remaining), dtype=np.bool_)
+        edge_ids = remaining.tolist()
+        chains = []
+        for idx in range(len(remaining)):
+            if used[idx]:
                 continue
             
-            if edge.edge_type in ['CIRCLE', 'POLYLINE']:
-                profile = Profile([edge], is_outer=True)
-                profile.is_closed = True
-                profile.calculate_properties()
-                profiles.append(profile)
-                used_edges.add(i)
-                print(f"  Found closed {edge.edge_type} profile (area={profile.area:.2f}mm²)")
-        
-        # Step 2: Chain remaining edges (lines, arcs, splines)
-        remaining_edges = [
-            (i, edge) for i, edge in enumerate(edges) 
-            if i not in used_edges
-        ]
-        
-        while remaining_edges:
             # Start a new chain
-            chain = []
-            idx, start_edge = remaining_edges.pop(0)
-            chain.append(start_edge)
-            used_edges.add(idx)
+            chain = [idx]
+            reversed_edges = [False]
+            used[idx] = True
             
-            # Track current endpoint for connection
-            current_end = start_edge.end_point
+            # Track current endpoint for connection, and where the chain closes
+            chain_start, current_end = lookup[idx]
             
-            # Assumption: Limit iterations to prevent infinite loops
-            max_iterations = len(remaining_edges) + 10
-            iterations = 0
-            
-            while iterations < max_iterations:
-                iterations += 1
-                found_connection = False
-                
-                for i, (idx, edge) in enumerate(remaining_edges):
-                    if idx in used_edges:
+            while has_endpoints[idx]:  # An edge without endpoints is a chain of its own
+                # Lowest edge index wins (start before end), matching the order of a
+                # linear scan over the remaining edges
+                match = None
+                for row in near(current_end):
+                    cand_idx = owners[row]
+                    if used[cand_idx]:
                         continue
-                    
-                    # Check if this edge connects to current end
-                    dist_to_start = edge.distance_to_point(current_end) if edge.start_point else float('inf')
-                    dist_to_end = edge.distance_to_point(current_end) if edge.end_point else float('inf')
-                    
-                    # Connect if within tolerance
-                    if dist_to_start < Config.EDGE_CONNECTION_TOLERANCE:
-                        chain.append(edge)
-                        used_edges.add(idx)
-                        remaining_edges.pop(i)
-                        current_end = edge.end_point
-                        found_connection = True
-                        break
-                    elif dist_to_end < Config.EDGE_CONNECTION_TOLERANCE:
-                        # Assumption: Reversing edge by swapping start/end conceptually
-                        chain.append(edge)
-                        used_edges.add(idx)
-                        remaining_edges.pop(i)
-                        current_end = edge.start_point
-                        found_connection = True
-                        break
+                    rank = (cand_idx, at_end[row])
+                    if _dist2(points[row], current_end) < tol_sq and (match is None or rank < match):
+                        match = rank
+                
+                if match is None:
+                    break
+                
+                # Connecting at the candidate's end means it is walked in reverse
+                cand_idx, reversed_edge = match
+                chain.append(cand_idx)
+                reversed_edges.append(reversed_edge)
+                used[cand_idx] = True
+                
+                # Far endpoint by index: the start when walked reversed, else the end
+                current_end = lookup[cand_idx][not reversed_edge]
                 
-                if not found_connection:
+                # Back at the start: the loop is closed, don't pull in stray edges
+                # touching this joint (closure itself is judged by calculate_properties)
+                if _dist2(current_end, chain_start) < tol_sq:
                     break
             
-            # Create profile if sufficient edges
-            if len(chain) >= Config.MIN_PROFILE_EDGES:
-                profile = Profile(chain, is_outer=True)
+            chains.append(([edge_ids[i] for i in chain], reversed_edges))
+        return chains
+    
+    @staticmethod
+    def _cell_keys(rows: np.ndarray, tol: float) -> Tuple[np.ndarray, int, int, int]:
+        """
+        Integer key of each endpoint row's tol-sized grid cell (same cells as _endpoint_cell)
+        Returns (keys, origin_x, origin_y, width); key = (cx - origin_x) * width + (cy - origin_y),
+        with one empty cell of margin on every side so neighbour keys never wrap.
+        """
+        if not len(rows):
+            return np.zeros(0, dtype=np.int64), 0, 0, 1
+        cells = np.floor(rows / tol).astype(np.int64)
+        origin = cells.min(axis=0) - 1
+        width = int(cells[:, 1].max() - origin[1]) + 2
+        keys = (cells[:, 0] - origin[0]) * width + (cells[:, 1] - origin[1])
+        return keys, int(origin[0]), int(origin[1]), width
+    
+    @staticmethod
+    def _endpoint_components(rows: np.ndarray) -> np.ndarray:
+        """
+        Connected-component label per edge: edges with endpoints within
+        EDGE_CONNECTION_TOLERANCE of each other (transitively) share a label.
+        rows: (2R, 2) starts then ends of the edges (EdgeArray.endpoint_rows layout)
+        A chain never leaves its component, so components can be walked independently.
+        """
+        tol = Config.EDGE_CONNECTION_TOLERANCE
+        n = len(rows) // 2
+        owners = np.tile(np.arange(n), 2)
+        valid = ~np.isnan(rows[:, 0])
+        rows, owners = rows[valid], owners[valid]
+        keys, _, _, width = ProfileDetector._cell_keys(rows, tol)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        
+        # Candidate row pairs from the 3x3 neighbouring cells, as sorted-key ranges
+        # expanded into flat index arrays; kept when within tolerance
+        pair_a, pair_b = [], []
+        for offset in (-width - 1, -width, -width + 1, -1, 0, 1, width - 1, width, width + 1):
+            lo = np.searchsorted(sorted_keys, keys + offset, side='left')
+            counts = np.searchsorted(sorted_keys, keys + offset, side='right') - lo
+            a = np.repeat(np.arange(len(rows)), counts)
+            b = order[np.repeat(lo - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+            d = rows[a] - rows[b]
+            close = (a < b) & (np.einsum('ij,ij->i', d, d) < Config.EDGE_CONNECTION_TOLERANCE_SQ)
+            pair_a.append(owners[a[close]])
+            pair_b.append(owners[b[close]])
+        pair_a = np.concatenate(pair_a)
+        pair_b = np.concatenate(pair_b)
+        
+        # Union-find by rounds: hook each larger root onto the smaller one, then
+        # compress every path to its root; the lowest edge id ends up as the label
+        labels = np.arange(n)
+        while True:
+            root_a, root_b = labels[pair_a], labels[pair_b]
+            split = root_a != root_b
+            if not split.any():
+                return labels
+            root_a, root_b = root_a[split], root_b[split]
+            pair_a, pair_b = pair_a[split], pair_b[split]
+            np.minimum.at(labels, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+            while True:
+                parents = labels[labels]
+                if np.array_equal(parents, labels):
+                    break
+                labels = parents
+    
+    @staticmethod
+    def _chain_components(edge_array: EdgeArray, remaining: np.ndarray) -> List[Tuple[List[int], List[bool]]]:
+        """
+        _chain_indexed over the remaining edges; with at least
+        Config.PARALLEL_CHAIN_THRESHOLD of them, connected components are chained
+        in a process pool. Chains come back in the order of the serial walk.
+        """
+        rows = edge_array.endpoint_rows(remaining)
+        starts, ends = rows[:len(remaining)], rows[len(remaining):]
+        if len(remaining) < Config.PARALLEL_CHAIN_THRESHOLD:
+            return ProfileDetector._chain_indexed(starts, ends, remaining)
+        
+        labels = ProfileDetector._endpoint_components(rows)
+        order = np.argsort(labels, kind='stable')  # Keeps edge order within each component
+        splits = np.flatnonzero(np.diff(labels[order])) + 1
+        jobs = [(starts[ids], ends[ids], remaining[ids]) for ids in np.split(order, splits)]
+        
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_chain_component, jobs, chunksize=max(1, len(jobs) // (4 * workers)))
+            chains = [chain for component in results for chain in component]
+        
+        # Serial walk order: chains start at increasing edge indices
+        chains.sort(key=lambda chain: chain[0][0])
+        return chains
+    
+    @staticmethod
+    def _chain_compiled(edge_array: EdgeArray, remaining: np.ndarray) -> List[Tuple[List[int], List[bool]]]:
+        """Same walk as _chain_indexed, run by the Numba kernel over a sorted-cell endpoint grid"""
+        tol = Config.EDGE_CONNECTION_TOLERANCE
+        rows = edge_array.endpoint_rows(remaining)
+        starts, ends = rows[:len(remaining)], rows[len(remaining):]
+        
+        # Endpoint rows (local edge ids) bucketed by tol-sized cell, CSR-style: rows
+        # sorted by cell key, each cell found with a binary search in the kernel
+        owners = np.concatenate((np.arange(len(remaining)),) * 2)
+        at_end = np.repeat((False, True), len(remaining))
+        valid = ~np.isnan(rows[:, 0])
+        rows, owners, at_end = rows[valid], owners[valid], at_end[valid]
+        keys, origin_x, origin_y, width = ProfileDetector._cell_keys(rows, tol)
+        order = np.argsort(keys, kind='stable')
+        
+        order_ids, reversed_flags, offsets = _chain_kernel(
+            np.stack((starts, ends), axis=1), rows[order], owners[order], at_end[order], keys[order],
+            origin_x, origin_y, width, tol, Config.EDGE_CONNECTION_TOLERANCE_SQ)
+        
+        # Back to edge indices, one (ids, reversed) pair per chain
+        order_ids = remaining[order_ids].tolist()
+        reversed_flags = reversed_flags.tolist()
+        offsets = offsets.tolist()
+        return [(order_ids[a:b], reversed_flags[a:b]) for a, b in zip(offsets[:-1], offsets[1:])]
+    
+    @staticmethod
+    def _chain_properties(profiles: List[Profile], chains: List[Tuple[List[int], List[bool]]],
+                          edge_array: EdgeArray):
+        """
+        Profile.calculate_properties for many chained profiles at once
+        Gathers every chain's oriented endpoints from the SoA arrays and reduces them
+        per profile (shoelace area, centroid, bounding box, closure gap) in one pass.
+        """
+        if not profiles:
+            return
+        
+        ids = np.fromiter((i for chain_ids, _ in chains for i in chain_ids), dtype=np.intp)
+        flipped = np.fromiter((r for _, reversed_edges in chains for r in reversed_edges), dtype=np.bool_,
+                              count=len(ids))[:, None]
+        rows = edge_array.endpoint_rows(ids)
+        starts, ends = rows[:len(ids)], rows[len(ids):]
+        first = np.where(flipped, ends, starts)  # Endpoints in walk direction
+        second = np.where(flipped, starts, ends)
+        
+        points, keep = _chain_points(first, second)
+        lengths = np.fromiter((len(chain_ids) for chain_ids, _ in chains), dtype=np.intp, count=len(chains))
+        owner = np.repeat(np.arange(len(profiles)), 2 * lengths)[keep]
+        points = points[keep]
+        counts = np.bincount(owner, minlength=len(profiles))
+        
+        # Profiles with too few points keep their defaults, as in calculate_properties
+        valid = counts >= Config.MIN_PROFILE_EDGES
+        for profile in profiles:
+            profile._props_computed = True
+            profile._closure_cache = None
+        if not valid.any():
+            return
+        points = points[valid[owner]]  # Still grouped by profile, in profile order
+        
+        rows = zip(*_shoelace_properties(points, counts[valid]))
+        for profile_idx, row in zip(np.flatnonzero(valid).tolist(), rows):
+            profiles[profile_idx]._set_properties(*row)
+    
+    @staticmethod
+    def chain_edges_into_profiles(edges: List[GeometricEdge],
+                                  edge_array: Optional[EdgeArray] = None) -> List[Profile]:
+        """Chain disconnected edges into closed profiles (edge_array: EdgeArray over edges, built if omitted)"""
+        log.debug("Chaining edges into profiles...")
+        
+        profiles = []
+        used = np.zeros(len(edges), dtype=np.bool_)  # Edge already placed in a profile
+        
+        # Step 1: Handle circles and closed polylines (already closed)
+        for i, edge in enumerate(edges):
+            if edge.edge_type in ['CIRCLE', 'POLYLINE']:
+                profile = Profile([edge], is_outer=True, primary_kind=edge.edge_type)
+                profile.is_closed = True
                 profile.calculate_properties()
                 profiles.append(profile)
-                
-                status = "closed" if profile.is_closed else f"open (gap={profile.closure_gap:.3f}mm)"
-                print(f"  Chained profile: {len(chain)} edges, area={profile.area:.2f}mm², {status}")
+                used[i] = True
+                log.debug("  Found closed %s profile (area=%.2fmm²)", edge.edge_type, profile.area)
+        
+        # Step 2: Chain remaining edges (lines, arcs, splines): compiled kernel when
+        # Numba is installed, else the Python loop over a grid endpoint index
+        # (per connected component in a process pool for large drawings)
+        if edge_array is None:
+            edge_array = EdgeArray(edges)
+        remaining = np.flatnonzero(~used)
+        if njit is not None:
+            chains = ProfileDetector._chain_compiled(edge_array, remaining)
+        else:
+            chains = ProfileDetector._chain_components(edge_array, remaining)
+        
+        # Create profiles from chains with sufficient edges (or arcs closing a full
+        # circle); their properties are computed together in one vectorized pass
+        chains = [chain for chain in chains
+                  if len(chain[0]) >= Config.MIN_PROFILE_EDGES
+                  or arc_circle([edges[i] for i in chain[0]]) is not None]
+        chained = [Profile([edges[i] for i in chain_ids], is_outer=True, reversed_edges=reversed_edges,
+                           primary_kind='MIXED')
+                   for chain_ids, reversed_edges in chains]
+        ProfileDetector._chain_properties(chained, chains, edge_array)
+        
+        debug = log.isEnabledFor(logging.DEBUG)
+        for profile in chained:
+            profiles.append(profile)
+            if not debug:
+                continue
+            if profile.is_closed:
+                log.debug("  Chained profile: %d edges, area=%.2fmm², closed", len(profile.edges), profile.area)
+            else:
+                log.debug("  Chained profile: %d edges, area=%.2fmm², open (gap=%.3fmm)",
+                          len(profile.edges), profile.area, profile.closure_gap)
         
         # Sort profiles by area (largest first = likely base feature)
         profiles.sort(key=lambda p: p.area, reverse=True)
@@ -166,5 +563,10 @@ class ProfileDetector:
             for p in profiles[1:]:
                 p.is_outer = False  # Assumption: Smaller profiles are holes/cuts
         
-        print(f"✓ Created {len(profiles)} profiles from chained edges")
-        return profiles
\ No newline at end of file
+        log.info("✓ Created %d profiles from chained edges", len(profiles))
+        return profiles
+
+
+def _chain_component(job: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> List[Tuple[List[int], List[bool]]]:
+    """Process-pool worker: chain one connected component (starts, ends, edge indices)"""
+    return ProfileDetector._chain_indexed(*job)